@@ -7,6 +7,9 @@ using Microsoft.Agents.Builder.App.UserAuth;
 using Microsoft.Agents.Builder.State;
 using Microsoft.Agents.Core.Models;
 using Microsoft.SemanticKernel;
+using System.Diagnostics;
+using System.Runtime.CompilerServices;
+using System.Text;
 using System.Text.Json;
 
 namespace AgentOrchestrator.Agent;
@@ -18,25 +21,61 @@ public class OrchestratorAgent : AgentApplication
     private readonly IHttpContextAccessor _httpContextAccessor;
     private readonly OrchestrationSettings _orchestrationSettings;
     private readonly ILogger<OrchestratorAgent> _logger;
-    private readonly IServiceProvider sp;
+    private readonly AgentContextAccessor _agentContextAccessor;
+    private readonly KernelFunction _analyzeIntentFunction;
+    private readonly KernelFunction _queryBatchFunction;
+    private readonly KernelFunction _synthesizeFunction;
+
+    /// <summary>
+    /// Routes each intent type to the agent name and kernel function that handles it.
+    /// Every agent function takes the intent's sub-query as its "query" argument.
+    /// </summary>
+    private readonly Dictionary<IntentType, AgentRoute> _agentRoutes;
+
     private const int MaxMessageLength = 4000;
 
+    /// <summary>
+    /// Ends an answer that failed after part of it was already streamed to the user.
+    /// </summary>
+    private const string InterruptedResponseNotice = "\n\n_(The response was interrupted. Please try again for the full answer.)_";
+
     private const string AgenticAuthHandler = "agentic";
     private const string NonAgenticAuthHandler = "me";
 
+    private const string M365CopilotAgent = "m365_copilot";
+    private const string AzureOpenAIAgent = "azure_openai";
+
     public OrchestratorAgent(
         AgentApplicationOptions options,
         Kernel kernel,
         IHttpContextAccessor httpContextAccessor,
         OrchestrationSettings orchestrationSettings,
         ILogger<OrchestratorAgent> logger,
-        IServiceProvider serviceProvider) : base(options)
+        AgentContextAccessor agentContextAccessor) : base(options)
     {
-        sp= serviceProvider;
-        _kernel = kernel.Clone();
+        // PERFORMANCE: Use the shared singleton kernel directly. Cloning it copied the plugin
+        // collection and filter lists on every turn; nothing here mutates the kernel, and per-turn
+        // state reaches the plugins through AgentContextAccessor instead.
+        _kernel = kernel;
         _httpContextAccessor = httpContextAccessor;
         _orchestrationSettings = orchestrationSettings;
         _logger = logger;
+        _agentContextAccessor = agentContextAccessor;
+
+        // RELIABILITY: Resolve the orchestration steps and agent functions up front, so a plugin that isn't
+        // registered fails when the agent is created rather than mid-turn. The agent is created per request,
+        // so this is still one lookup per function per turn - it saves nothing over invoking by name.
+        _analyzeIntentFunction = _kernel.Plugins.GetFunction(PluginNames.Intent, "AnalyzeIntent");
+        _queryBatchFunction = _kernel.Plugins.GetFunction(PluginNames.M365Copilot, "QueryBatch");
+        _synthesizeFunction = _kernel.Plugins.GetFunction(PluginNames.Synthesis, "Synthesize");
+        _agentRoutes = new()
+        {
+            [IntentType.M365Email] = new(M365CopilotAgent, _kernel.Plugins.GetFunction(PluginNames.M365Copilot, "QueryEmails")),
+            [IntentType.M365Calendar] = new(M365CopilotAgent, _kernel.Plugins.GetFunction(PluginNames.M365Copilot, "QueryCalendar")),
+            [IntentType.M365Files] = new(M365CopilotAgent, _kernel.Plugins.GetFunction(PluginNames.M365Copilot, "QueryFiles")),
+            [IntentType.M365People] = new(M365CopilotAgent, _kernel.Plugins.GetFunction(PluginNames.M365Copilot, "QueryPeople")),
+            [IntentType.GeneralKnowledge] = new(AzureOpenAIAgent, _kernel.Plugins.GetFunction(PluginNames.AzureOpenAI, "GeneralKnowledge"))
+        };
 
         // Register activity handlers
         OnActivity(ActivityTypes.ConversationUpdate, OnConversationUpdateAsync);
@@ -53,9 +92,9 @@ public class OrchestratorAgent : AgentApplication
         // Set the auth handler to pass to tools based on whether this is an agentic request or not.
         string AuthHandlerName = turnContext.IsAgenticRequest() ? AgenticAuthHandler : NonAgenticAuthHandler;
 
-        var userMessage = turnContext.Activity.Text?.Trim() ?? string.Empty;
+        var rawMessage = turnContext.Activity.Text;
 
-        if (string.IsNullOrEmpty(userMessage))
+        if (string.IsNullOrWhiteSpace(rawMessage))
         {
             await turnContext.SendActivityAsync(
                 MessageFactory.Text("Please enter a message."),
@@ -64,6 +103,9 @@ public class OrchestratorAgent : AgentApplication
         }
 
         // Input validation
+        // SECURITY: Reject grossly oversized input before Trim() copies it - surrounding whitespace
+        // can't account for more than the limit again.
+        var userMessage = rawMessage.Length > MaxMessageLength * 2 ? rawMessage : rawMessage.Trim();
         if (userMessage.Length > MaxMessageLength)
         {
             await turnContext.SendActivityAsync(
@@ -72,89 +114,162 @@ public class OrchestratorAgent : AgentApplication
             return;
         }
 
-        _logger.LogInformation("Processing message: {Message}", userMessage);
+        if (_logger.IsEnabled(LogLevel.Information))
+        {
+            _logger.LogInformation("Processing message: {Message}", QueryLogging.Truncate(userMessage));
+        }
 
+        CancellationTokenSource? speculativeCts = null;
+        ConversationMemory? memory = null;
+        var finalResponse = new StringBuilder();
         try
         {
             // Create timeout-aware cancellation token
+            var stopwatch = Stopwatch.StartNew();
             using var timeoutCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
             timeoutCts.CancelAfter(TimeSpan.FromSeconds(_orchestrationSettings.TimeoutSeconds));
             var timeoutToken = timeoutCts.Token;
             
-            // Setup the Kernel with tools/plugins in the current conversation context
-            UpdateChatClientWithToolsInContext(turnContext, turnState, UserAuthorization, AuthHandlerName);
+            // Make the current conversation context available to the kernel plugins
+            SetAgentContext(turnContext, turnState, UserAuthorization, AuthHandlerName);
+
+            // Recent exchanges give intent analysis and synthesis context for follow-up questions
+            memory = _orchestrationSettings.ConversationMemoryTurns > 0
+                ? turnState.Conversation.GetValue<ConversationMemory>(ConversationMemory.StateKey) ?? new()
+                : null;
+            var history = memory?.ToPromptContext() ?? string.Empty;
+
+            // PERFORMANCE: Optionally start the general knowledge agent while intent analysis runs.
+            // Single general knowledge intents are the most common case, so this hides one LLM round-trip.
+            // Only the first message of a conversation is speculated on: a follow-up ("what about
+            // Kubernetes?") needs the sub-query that intent analysis rewrites from the history.
+            Task<AgentResponse>? speculativeTask = null;
+            if (_orchestrationSettings.EnableSpeculativeExecution && history.Length == 0)
+            {
+                speculativeCts = CancellationTokenSource.CreateLinkedTokenSource(timeoutToken);
+                speculativeTask = ExecuteAgentForIntentAsync(
+                    new Intent { Type = IntentType.GeneralKnowledge, Query = userMessage },
+                    speculativeCts.Token);
+            }
 
             // Step 1: Analyze intent
             _logger.LogInformation("Step 1: Analyzing intent...");
-            var intents = await AnalyzeIntentAsync(userMessage, timeoutToken);
+            var intents = await AnalyzeIntentAsync(userMessage, history, timeoutToken);
 
             // Apply MaxAgentCalls limit
             if (intents.Count > _orchestrationSettings.MaxAgentCalls)
             {
                 _logger.LogWarning("Truncating intents from {Count} to {Max}",
                     intents.Count, _orchestrationSettings.MaxAgentCalls);
-                intents = intents.Take(_orchestrationSettings.MaxAgentCalls).ToList();
+                intents.RemoveRange(_orchestrationSettings.MaxAgentCalls, intents.Count - _orchestrationSettings.MaxAgentCalls);
             }
 
-            _logger.LogInformation("Detected {Count} intent(s): {Intents}",
-                intents.Count,
-                string.Join(", ", intents.Select(i => i.Type)));
+            // PERFORMANCE: Only build the intent list when Information logging is on
+            if (_logger.IsEnabled(LogLevel.Information))
+            {
+                _logger.LogInformation("Detected {Count} intent(s): {Intents}",
+                    intents.Count,
+                    string.Join(", ", intents.Select(i => i.Type.ToName())));
+            }
 
             // Step 2: Execute agents based on intents
-            _logger.LogInformation("Step 2: Executing agents (parallel={Parallel})...",
-                _orchestrationSettings.EnableParallelExecution);
-            var responses = await ExecuteAgentsAsync(intents, timeoutToken);
+            IReadOnlyList<AgentResponse> responses;
+            if (speculativeTask != null && intents is [{ Type: IntentType.GeneralKnowledge }])
+            {
+                _logger.LogInformation("Step 2: Using speculative general knowledge response...");
+                responses = [await speculativeTask];
+            }
+            else
+            {
+                // Speculation missed (or wasn't started) - stop the in-flight general knowledge call
+                speculativeCts?.Cancel();
+
+                _logger.LogInformation("Step 2: Executing agents (parallel={Parallel})...",
+                    _orchestrationSettings.EnableParallelExecution);
+                responses = await ExecuteAgentsAsync(intents, GetAgentBudget(
+                    TimeSpan.FromSeconds(_orchestrationSettings.TimeoutSeconds),
+                    TimeSpan.FromSeconds(_orchestrationSettings.SynthesisReserveSeconds),
+                    stopwatch.Elapsed), timeoutToken);
+            }
 
-            // Step 3: Synthesize response
-            _logger.LogInformation("Step 3: Synthesizing response...");
-            var finalResponse = await SynthesizeResponseAsync(userMessage, responses, timeoutToken);
+            // Step 3: Synthesize and send the response
+            // PERFORMANCE: Synthesized text is forwarded chunk by chunk as the LLM produces it, so the
+            // user sees the answer start at the model's first token rather than after the full completion.
+            _logger.LogInformation("Step 3: Synthesizing and streaming response...");
+            await foreach (var chunk in SynthesizeResponseAsync(userMessage, responses, history, timeoutToken))
+            {
+                turnContext.StreamingResponse.QueueTextChunk(chunk);
+                finalResponse.Append(chunk);
+            }
 
-            // Step 4: Send response
-            turnContext.StreamingResponse.QueueTextChunk(finalResponse);
+            RememberExchange();
 
             _logger.LogInformation("Response sent successfully");
         }
         catch (UnauthorizedAccessException)
         {
-            turnContext.StreamingResponse.QueueTextChunk("Please log in to access M365 features. Visit the web interface to authenticate.");
+            QueueError("Please log in to access M365 features. Visit the web interface to authenticate.");
         }
         catch (OperationCanceledException) when (!cancellationToken.IsCancellationRequested)
         {
             _logger.LogWarning("Request timed out after {Seconds} seconds", _orchestrationSettings.TimeoutSeconds);
-            turnContext.StreamingResponse.QueueTextChunk("The request timed out. Please try a simpler query or try again later.");
+            QueueError("The request timed out. Please try a simpler query or try again later.");
         }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error processing message");
             // Don't expose internal error details to users
-            turnContext.StreamingResponse.QueueTextChunk("Sorry, an error occurred processing your request. Please try again.");
+            QueueError("Sorry, an error occurred processing your request. Please try again.");
         }
         finally
         {
+            // The speculative general knowledge call must not outlive the turn, whichever way it ended
+            speculativeCts?.Cancel();
+            speculativeCts?.Dispose();
+            _agentContextAccessor.AgentContext = null;
             await turnContext.StreamingResponse.EndStreamAsync(cancellationToken);
         }
+
+        void QueueError(string message)
+        {
+            if (finalResponse.Length == 0)
+            {
+                turnContext.StreamingResponse.QueueTextChunk(message);
+                return;
+            }
+
+            // Part of the answer has already been streamed - end it rather than appending an error
+            // mid-sentence, and remember what the user saw so follow-ups still have context
+            turnContext.StreamingResponse.QueueTextChunk(InterruptedResponseNotice);
+            RememberExchange();
+        }
+
+        void RememberExchange()
+        {
+            if (memory != null)
+            {
+                memory.Add(userMessage, finalResponse.ToString(), _orchestrationSettings.ConversationMemoryTurns);
+                turnState.Conversation.SetValue(ConversationMemory.StateKey, memory);
+            }
+        }
     }
 
-    private async Task<List<Intent>> AnalyzeIntentAsync(string query, CancellationToken cancellationToken)
+    private async Task<List<Intent>> AnalyzeIntentAsync(string query, string history, CancellationToken cancellationToken)
     {
         var result = await _kernel.InvokeAsync(
-            PluginNames.Intent,
-            "AnalyzeIntent",
-            new() { ["query"] = query },
+            _analyzeIntentFunction,
+            new() { ["query"] = query, ["history"] = history },
             cancellationToken);
 
         var json = result.GetValue<string>() ?? "[]";
 
         try
         {
-            var intents = JsonSerializer.Deserialize<List<Intent>>(json, new JsonSerializerOptions
-            {
-                PropertyNameCaseInsensitive = true
-            });
+            var intents = JsonSerializer.Deserialize(json, AgentOrchestratorJsonContext.Default.ListIntent);
 
             if (intents == null || intents.Count == 0)
             {
-                _logger.LogWarning("Intent analysis returned empty results for query: {Query}", query);
+                _logger.LogWarning("Intent analysis returned empty results for query: {Query}", QueryLogging.Truncate(query));
                 return [new Intent { Type = IntentType.GeneralKnowledge, Query = query }];
             }
 
@@ -169,57 +284,159 @@ public class OrchestratorAgent : AgentApplication
         }
     }
 
-    private async Task<List<AgentResponse>> ExecuteAgentsAsync(
+    /// <summary>
+    /// Computes how long the agents may run: the remaining request budget minus the time reserved
+    /// for synthesis, but never less than half of what remains.
+    /// </summary>
+    internal static TimeSpan GetAgentBudget(TimeSpan timeout, TimeSpan synthesisReserve, TimeSpan elapsed)
+    {
+        var remaining = timeout - elapsed;
+        var budget = remaining - synthesisReserve;
+        var minimum = remaining / 2;
+
+        return budget > minimum ? budget : (minimum > TimeSpan.Zero ? minimum : TimeSpan.Zero);
+    }
+
+    private async Task<IReadOnlyList<AgentResponse>> ExecuteAgentsAsync(
         List<Intent> intents,
+        TimeSpan agentBudget,
         CancellationToken cancellationToken)
     {
+        // RELIABILITY: Agents share a deadline that leaves time for synthesis. A slow agent times out
+        // on its own and the other responses are still used, instead of the whole request timing out.
+        using var agentCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        agentCts.CancelAfter(agentBudget);
+
+        Task<AgentResponse> RunWithinBudgetAsync(
+            Intent intent,
+            Func<CancellationToken, Task<AgentResponse>> execute) =>
+            ExecuteWithinBudgetAsync(intent, execute, agentBudget, agentCts.Token, cancellationToken, _logger);
+
+        var m365Batch = GetM365Batch(intents, _orchestrationSettings.BatchM365Intents);
+        var batchM365 = m365Batch.Count > 0;
+
+        var calls = new List<Func<Task<AgentResponse>>>(intents.Count);
+        if (batchM365)
+        {
+            calls.Add(() => RunWithinBudgetAsync(m365Batch[0], token => ExecuteM365BatchAsync(m365Batch, token)));
+        }
+        foreach (var intent in intents)
+        {
+            if (!batchM365 || !intent.IsM365Intent)
+            {
+                calls.Add(() => RunWithinBudgetAsync(intent, token => ExecuteAgentForIntentAsync(intent, token)));
+            }
+        }
+
         if (_orchestrationSettings.EnableParallelExecution)
         {
-            var tasks = intents.Select(intent => ExecuteAgentForIntentAsync(intent, cancellationToken));
-            var responses = await Task.WhenAll(tasks);
-            return responses.ToList();
+            // PERFORMANCE: Return the WhenAll result array as-is instead of copying it into a list
+            var tasks = calls.Select(call => call());
+            return await Task.WhenAll(tasks);
         }
         else
         {
             // Sequential execution
-            var responses = new List<AgentResponse>();
-            foreach (var intent in intents)
+            var responses = new List<AgentResponse>(calls.Count);
+            foreach (var call in calls)
             {
-                var response = await ExecuteAgentForIntentAsync(intent, cancellationToken);
+                var response = await call();
                 responses.Add(response);
             }
             return responses;
         }
     }
 
+    /// <summary>
+    /// Returns the M365 intents to send to Copilot as one batch, or an empty list when they should
+    /// be queried individually (batching is off, or there are fewer than two M365 intents).
+    /// </summary>
+    /// <remarks>
+    /// PERFORMANCE: Multiple M365 intents are sent to Copilot as one batched chat message,
+    /// so the token exchange and Copilot round-trip happen once instead of once per intent.
+    /// </remarks>
+    internal static List<Intent> GetM365Batch(List<Intent> intents, bool batchM365Intents)
+    {
+        if (!batchM365Intents)
+        {
+            return [];
+        }
+
+        var batch = intents.Where(i => i.IsM365Intent).ToList();
+        return batch.Count > 1 ? batch : [];
+    }
+
+    /// <summary>
+    /// Runs one agent call against the shared agent deadline. An agent that runs past the deadline
+    /// becomes a failed response; cancellation of the request itself still propagates.
+    /// </summary>
+    internal static async Task<AgentResponse> ExecuteWithinBudgetAsync(
+        Intent intent,
+        Func<CancellationToken, Task<AgentResponse>> execute,
+        TimeSpan agentBudget,
+        CancellationToken agentToken,
+        CancellationToken requestToken,
+        ILogger logger)
+    {
+        try
+        {
+            return await execute(agentToken);
+        }
+        catch (OperationCanceledException) when (!requestToken.IsCancellationRequested)
+        {
+            logger.LogWarning("Agent for intent {IntentType} exceeded its {Seconds:F0}s budget",
+                intent.Type, agentBudget.TotalSeconds);
+            return new AgentResponse
+            {
+                Agent = intent.Type.ToName(),
+                IntentType = intent.Type,
+                Content = "The request timed out.",
+                Success = false
+            };
+        }
+    }
+
     private async Task<AgentResponse> ExecuteAgentForIntentAsync(
         Intent intent,
         CancellationToken cancellationToken)
     {
+        if (!_agentRoutes.TryGetValue(intent.Type, out var route))
+        {
+            return new AgentResponse
+            {
+                Agent = "unknown",
+                IntentType = intent.Type,
+                Content = "I'm not sure how to handle that request.",
+                Success = false
+            };
+        }
+
         try
         {
-            return intent.Type switch
+            var result = await _kernel.InvokeAsync(
+                route.Function,
+                new() { ["query"] = intent.Query },
+                cancellationToken);
+
+            return new AgentResponse
             {
-                IntentType.M365Email => await ExecuteM365PluginAsync("QueryEmails", intent.Query, cancellationToken),
-                IntentType.M365Calendar => await ExecuteM365PluginAsync("QueryCalendar", intent.Query, cancellationToken),
-                IntentType.M365Files => await ExecuteM365PluginAsync("QueryFiles", intent.Query, cancellationToken),
-                IntentType.M365People => await ExecuteM365PluginAsync("QueryPeople", intent.Query, cancellationToken),
-                IntentType.GeneralKnowledge => await ExecuteGeneralKnowledgeAsync(intent.Query, cancellationToken),
-                _ => new AgentResponse
-                {
-                    Agent = "unknown",
-                    IntentType = intent.Type,
-                    Content = "I'm not sure how to handle that request.",
-                    Success = false
-                }
+                Agent = route.Agent,
+                IntentType = intent.Type,
+                Content = result.GetValue<string>() ?? string.Empty,
+                Success = true
             };
         }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            // Let cancellation propagate so the caller can tell a timeout apart from an agent error
+            throw;
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error executing agent for intent {IntentType}", intent.Type);
             return new AgentResponse
             {
-                Agent = intent.Type.ToString(),
+                Agent = intent.Type.ToName(),
                 IntentType = intent.Type,
                 Content = $"Error: {ex.Message}",
                 Success = false
@@ -227,90 +444,112 @@ public class OrchestratorAgent : AgentApplication
         }
     }
 
-    private async Task<AgentResponse> ExecuteM365PluginAsync(
-        string functionName,
-        string query,
+    private async Task<AgentResponse> ExecuteM365BatchAsync(
+        List<Intent> intents,
         CancellationToken cancellationToken)
     {
-        var result = await _kernel.InvokeAsync(
-            PluginNames.M365Copilot,
-            functionName,
-            new()
-            {
-                ["query"] = query
-            },
-            cancellationToken);
+        try
+        {
+            var result = await _kernel.InvokeAsync(
+                _queryBatchFunction,
+                new()
+                {
+                    ["queries"] = intents.Select(i => i.Query).ToArray()
+                },
+                cancellationToken);
 
-        return new AgentResponse
+            return new AgentResponse
+            {
+                Agent = M365CopilotAgent,
+                IntentType = intents[0].Type,
+                Content = result.GetValue<string>() ?? string.Empty,
+                Success = true,
+                Metadata = new()
+                {
+                    ["intentTypes"] = intents.Select(i => i.Type.ToName()).ToArray()
+                }
+            };
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
         {
-            Agent = "m365_copilot",
-            IntentType = functionName switch
+            throw;
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Error executing batched M365 agent for {Count} intents", intents.Count);
+            return new AgentResponse
             {
-                "QueryEmails" => IntentType.M365Email,
-                "QueryCalendar" => IntentType.M365Calendar,
-                "QueryFiles" => IntentType.M365Files,
-                "QueryPeople" => IntentType.M365People,
-                _ => IntentType.GeneralKnowledge
-            },
-            Content = result.GetValue<string>() ?? string.Empty,
-            Success = true
-        };
+                Agent = M365CopilotAgent,
+                IntentType = intents[0].Type,
+                Content = $"Error: {ex.Message}",
+                Success = false
+            };
+        }
     }
 
-    private async Task<AgentResponse> ExecuteGeneralKnowledgeAsync(
-        string query,
-        CancellationToken cancellationToken)
+    private async IAsyncEnumerable<string> SynthesizeResponseAsync(
+        string originalQuery,
+        IReadOnlyList<AgentResponse> responses,
+        string history,
+        [EnumeratorCancellation] CancellationToken cancellationToken)
     {
-        var result = await _kernel.InvokeAsync(
-            PluginNames.AzureOpenAI,
-            "GeneralKnowledge",
-            new() { ["query"] = query },
-            cancellationToken);
+        // PERFORMANCE: A single answer has nothing to combine - skip the synthesis LLM call
+        if (responses is [{ Success: true } onlyResponse])
+        {
+            yield return onlyResponse.Content;
+            yield break;
+        }
 
-        return new AgentResponse
+        // PERFORMANCE: Count the successful responses in one pass without copying them into a new list
+        AgentResponse? firstSuccess = null;
+        var successCount = 0;
+        foreach (var response in responses)
         {
-            Agent = "azure_openai",
-            IntentType = IntentType.GeneralKnowledge,
-            Content = result.GetValue<string>() ?? string.Empty,
-            Success = true
-        };
-    }
+            if (response.Success)
+            {
+                firstSuccess ??= response;
+                successCount++;
+            }
+        }
 
-    private async Task<string> SynthesizeResponseAsync(
-        string originalQuery,
-        List<AgentResponse> responses,
-        CancellationToken cancellationToken)
-    {
         // If only one successful response, return it directly
-        var successfulResponses = responses.Where(r => r.Success).ToList();
-        if (successfulResponses.Count == 1)
+        if (successCount == 1)
         {
-            return successfulResponses[0].Content;
+            yield return firstSuccess!.Content;
+            yield break;
         }
 
-        if (successfulResponses.Count == 0)
+        if (successCount == 0)
         {
-            return "I wasn't able to find an answer to your question.";
+            yield return "I wasn't able to find an answer to your question.";
+            yield break;
         }
 
-        // Multiple responses - synthesize them
-        var responsesJson = JsonSerializer.Serialize(successfulResponses.Select(r => new
-        {
-            agent = r.Agent,
-            content = r.Content
-        }));
+        // Multiple responses - synthesize them (failures are filtered while writing the JSON)
+        var responsesJson = SynthesisPlugin.FormatResponsesForSynthesis(responses.Where(r => r.Success));
 
-        var result = await _kernel.InvokeAsync(
-            PluginNames.Synthesis,
-            "Synthesize",
+        var hasContent = false;
+        await foreach (var chunk in _kernel.InvokeStreamingAsync<string>(
+            _synthesizeFunction,
             new()
             {
                 ["originalQuery"] = originalQuery,
-                ["responses"] = responsesJson
+                ["responses"] = responsesJson,
+                ["history"] = history
             },
-            cancellationToken);
+            cancellationToken))
+        {
+            if (!string.IsNullOrEmpty(chunk))
+            {
+                hasContent = true;
+                yield return chunk;
+            }
+        }
 
-        return result.GetValue<string>() ?? "I couldn't synthesize a response.";
+        if (!hasContent)
+        {
+            yield return "I couldn't synthesize a response.";
+        }
     }
 
     private async Task OnConversationUpdateAsync(
@@ -339,8 +578,8 @@ public class OrchestratorAgent : AgentApplication
     }
 
     /// <summary>
-    /// Registers conversation-scoped plugins with the kernel using the current turn context,
-    /// state, and user authorization. This enables tools to access <see cref="AgentContext"/>
+    /// Publishes the current turn context, state, and user authorization to the kernel plugins
+    /// through <see cref="AgentContextAccessor"/>. This enables tools to access <see cref="AgentContext"/>
     /// and operate with the appropriate authentication handler.
     /// </summary>
     /// <param name="turnContext">The current <see cref="ITurnContext"/> for the incoming activity.</param>
@@ -348,49 +587,18 @@ public class OrchestratorAgent : AgentApplication
     /// <param name="userAuthorization">The <see cref="UserAuthorization"/> for the active user or agent.</param>
     /// <param name="userAuthHandlerName">The name of the auth handler (e.g., agentic or non-agentic) used for tool calls.</param>
     /// <remarks>
-    /// This method wires up the following plugins:
-    /// <list type="bullet">
-    /// <item>Intent plugin for intent analysis</item>
-    /// <item>M365 Copilot plugin for email, calendar, files, and people queries</item>
-    /// <item>Azure OpenAI plugin for general knowledge</item>
-    /// <item>Synthesis plugin for response aggregation</item>
-    /// </list>
-    /// Each plugin receives an <see cref="AgentContext"/> instance to access the turn context,
-    /// turn state, and authorization data.
+    /// PERFORMANCE: The plugins are created and registered with the shared kernel once at startup
+    /// (see Program.cs) instead of on every turn, which avoids re-running Semantic Kernel's reflection
+    /// over the plugin methods per message. The context flows with the async call chain of this turn,
+    /// so concurrent turns each see their own <see cref="AgentContext"/>.
     /// </remarks>
-    private void UpdateChatClientWithToolsInContext(ITurnContext turnContext, 
-        ITurnState turnState, 
-        UserAuthorization userAuthorization, 
+    private void SetAgentContext(ITurnContext turnContext,
+        ITurnState turnState,
+        UserAuthorization userAuthorization,
         string userAuthHandlerName)
     {
-        AgentContext agentContext = new(turnContext, turnState, userAuthorization, userAuthHandlerName);
-
-        _kernel.Plugins.AddFromObject(
-            new IntentPlugin(
-                agentContext, _kernel, 
-                sp.GetRequiredService<ILogger<IntentPlugin>>()),
-        PluginNames.Intent);
-
-        _kernel.Plugins.AddFromObject(
-        new M365CopilotPlugin(
-            agentContext,
-            sp.GetRequiredService<IHttpClientFactory>(),
-            sp.GetRequiredService<MicrosoftGraphSettings>(),
-            sp.GetRequiredService<ILogger<M365CopilotPlugin>>()),
-        PluginNames.M365Copilot);
-
-        _kernel.Plugins.AddFromObject(
-        new AzureOpenAIPlugin(
-            agentContext,
-            _kernel, 
-            sp.GetRequiredService<ILogger<AzureOpenAIPlugin>>()),
-        PluginNames.AzureOpenAI);
-
-        _kernel.Plugins.AddFromObject(
-        new SynthesisPlugin(
-            agentContext,
-            _kernel,
-            sp.GetRequiredService<ILogger<SynthesisPlugin>>()),
-        PluginNames.Synthesis);
+        _agentContextAccessor.AgentContext = new(turnContext, turnState, userAuthorization, userAuthHandlerName);
     }
+
+    private readonly record struct AgentRoute(string Agent, KernelFunction Function);
 }
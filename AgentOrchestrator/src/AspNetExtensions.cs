@@ -170,8 +170,10 @@ public static class AspNetExtensions
                         return;
                     }
 
+                    // PERFORMANCE: Read the issuer straight from the payload - enumerating Claims builds
+                    // a Claim object for every claim in the token on each request
                     JsonWebToken token = new(parts[1]);
-                    string issuer = token.Claims.FirstOrDefault(claim => claim.Type == AuthenticationConstants.IssuerClaim)?.Value!;
+                    string issuer = token.Issuer;
 
                     if (validationOptions.AzureBotServiceTokenHandling && AuthenticationConstants.BotFrameworkTokenIssuer.Equals(issuer))
                     {
@@ -0,0 +1,86 @@
+using AgentOrchestrator.Constants;
+using Microsoft.SemanticKernel;
+
+namespace AgentOrchestrator.Caching;
+
+/// <summary>
+/// Semantic Kernel function invocation filter that serves cacheable plugin functions
+/// from <see cref="SemanticResponseCache"/>.
+///
+/// SEMANTIC KERNEL CONCEPTS:
+/// - Filters intercept every kernel.InvokeAsync call, so callers don't need to know about caching
+/// - Setting context.Result without calling next() short-circuits the function (no LLM call)
+///
+/// Only user-independent functions are cached: intent analysis and general knowledge.
+/// Paraphrase (similarity) hits are limited to general knowledge; intent analysis needs an exact match.
+/// Calls with conversation history bypass the cache - the result depends on more than the query.
+/// M365 Copilot results contain the user's own data and always bypass the cache.
+/// </summary>
+public sealed class SemanticCacheFilter : IFunctionInvocationFilter
+{
+    private const string QueryArgument = "query";
+    private const string HistoryArgument = "history";
+
+    /// <summary>
+    /// Cacheable functions, and whether each may also be served from the similarity tier.
+    /// </summary>
+    private static readonly Dictionary<(string Plugin, string Function), bool> CacheableFunctions = new()
+    {
+        // Exact match only: the intents carry sub-queries rewritten from the message, so a close
+        // paraphrase ("emails from John" vs "emails from Jane") would route the wrong sub-queries to M365
+        [(PluginNames.Intent, "AnalyzeIntent")] = false,
+        [(PluginNames.AzureOpenAI, "GeneralKnowledge")] = true
+    };
+
+    private readonly SemanticResponseCache _cache;
+    private readonly ILogger<SemanticCacheFilter>? _logger;
+
+    public SemanticCacheFilter(SemanticResponseCache cache, ILogger<SemanticCacheFilter>? logger = null)
+    {
+        _cache = cache;
+        _logger = logger;
+    }
+
+    public async Task OnFunctionInvocationAsync(FunctionInvocationContext context, Func<FunctionInvocationContext, Task> next)
+    {
+        var function = context.Function;
+        if (function.PluginName == null ||
+            !CacheableFunctions.TryGetValue((function.PluginName, function.Name), out var allowSimilarMatch) ||
+            !context.Arguments.TryGetValue(QueryArgument, out var argument) ||
+            argument is not string query ||
+            (context.Arguments.TryGetValue(HistoryArgument, out var history) && history is string { Length: > 0 }))
+        {
+            await next(context);
+            return;
+        }
+
+        var scope = $"{function.PluginName}.{function.Name}";
+        CacheLookup lookup;
+        try
+        {
+            lookup = await _cache.LookupAsync(scope, query, allowSimilarMatch, context.CancellationToken);
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            // RELIABILITY: The cache is optional - an embedding outage or throttling (429)
+            // must not fail the function, so run it uncached
+            _logger?.LogWarning(ex, "Semantic cache lookup failed for {Scope}; invoking without cache", scope);
+            await next(context);
+            return;
+        }
+
+        if (lookup.IsHit)
+        {
+            _logger?.LogDebug("Semantic cache hit for {Scope}", scope);
+            context.Result = new FunctionResult(function, lookup.Value);
+            return;
+        }
+
+        await next(context);
+
+        if (context.Result.GetValue<string>() is { Length: > 0 } value)
+        {
+            _cache.Store(lookup, value);
+        }
+    }
+}
@@ -0,0 +1,168 @@
+using AgentOrchestrator.Models;
+using Microsoft.Extensions.AI;
+using System.Collections.Concurrent;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace AgentOrchestrator.Caching;
+
+/// <summary>
+/// Two-tier cache for LLM results keyed on the user's query.
+///
+/// PERFORMANCE: Intent analysis and general knowledge answers are pure functions of the
+/// query text, so repeated or paraphrased questions don't need another Azure OpenAI round-trip.
+/// - Tier 1: Exact match on a SHA-256 hash of the normalized query
+/// - Tier 2: Cosine similarity between query embeddings (only when an embedding model is configured)
+///
+/// Entries expire after <see cref="SemanticCacheSettings.TimeToLiveSeconds"/> so stale answers
+/// age out. Never cache user-specific results (M365 data) here - the cache is shared by all users.
+/// </summary>
+public class SemanticResponseCache
+{
+    private readonly ConcurrentDictionary<string, CacheEntry> _entries = new();
+    private readonly SemanticCacheSettings _settings;
+    private readonly IEmbeddingGenerator<string, Embedding<float>>? _embeddingGenerator;
+    private readonly TimeProvider _timeProvider;
+
+    public SemanticResponseCache(
+        SemanticCacheSettings settings,
+        IEmbeddingGenerator<string, Embedding<float>>? embeddingGenerator = null,
+        TimeProvider? timeProvider = null)
+    {
+        _settings = settings;
+        _embeddingGenerator = embeddingGenerator;
+        _timeProvider = timeProvider ?? TimeProvider.System;
+    }
+
+    /// <summary>
+    /// Looks up a cached value for the query. The returned <see cref="CacheLookup"/> carries the
+    /// computed embedding so a subsequent <see cref="Store"/> doesn't need to generate it again.
+    /// </summary>
+    /// <param name="scope">Partitions the cache, e.g. the plugin function that produced the value.</param>
+    /// <param name="query">The user's query.</param>
+    /// <param name="allowSimilarMatch">
+    /// Whether a paraphrased query may be served from the similarity tier. Only safe when the cached value
+    /// doesn't depend on details that differ between paraphrases (names, dates) - otherwise exact match only.
+    /// </param>
+    /// <param name="cancellationToken">Cancellation token for the embedding call.</param>
+    public async Task<CacheLookup> LookupAsync(
+        string scope,
+        string query,
+        bool allowSimilarMatch = true,
+        CancellationToken cancellationToken = default)
+    {
+        var key = ComputeKey(scope, query);
+        var now = _timeProvider.GetUtcNow();
+
+        if (_entries.TryGetValue(key, out var exact) && exact.ExpiresAt > now)
+        {
+            return new CacheLookup(scope, key, exact.Embedding, exact.Value);
+        }
+
+        if (_embeddingGenerator == null || !allowSimilarMatch)
+        {
+            return new CacheLookup(scope, key, null, null);
+        }
+
+        var embeddings = await _embeddingGenerator.GenerateAsync([query], cancellationToken: cancellationToken);
+        var vector = embeddings[0].Vector;
+
+        CacheEntry? best = null;
+        var bestSimilarity = _settings.SimilarityThreshold;
+        foreach (var entry in _entries.Values)
+        {
+            if (entry.Scope != scope || entry.ExpiresAt <= now || entry.Embedding is not { } candidate)
+            {
+                continue;
+            }
+
+            var similarity = CosineSimilarity(vector.Span, candidate.Span);
+            if (similarity >= bestSimilarity)
+            {
+                best = entry;
+                bestSimilarity = similarity;
+            }
+        }
+
+        return new CacheLookup(scope, key, vector, best?.Value);
+    }
+
+    /// <summary>
+    /// Stores a value for a previous cache miss, evicting expired entries when the cache is full.
+    /// </summary>
+    public void Store(CacheLookup lookup, string value)
+    {
+        if (_settings.MaxEntries <= 0)
+        {
+            return;
+        }
+
+        var now = _timeProvider.GetUtcNow();
+
+        if (_entries.Count >= _settings.MaxEntries)
+        {
+            EvictExpired(now);
+        }
+
+        if (_entries.Count >= _settings.MaxEntries)
+        {
+            // Still full - drop the entry closest to expiry
+            var oldest = _entries.MinBy(e => e.Value.ExpiresAt);
+            _entries.TryRemove(oldest.Key, out _);
+        }
+
+        _entries[lookup.Key] = new CacheEntry(
+            lookup.Scope,
+            value,
+            lookup.Embedding,
+            now.AddSeconds(_settings.TimeToLiveSeconds));
+    }
+
+    /// <summary>
+    /// Computes the cosine similarity of two vectors. Returns 0 for mismatched or zero-length vectors.
+    /// </summary>
+    public static double CosineSimilarity(ReadOnlySpan<float> x, ReadOnlySpan<float> y)
+    {
+        if (x.Length != y.Length || x.Length == 0)
+        {
+            return 0;
+        }
+
+        double dot = 0, normX = 0, normY = 0;
+        for (var i = 0; i < x.Length; i++)
+        {
+            dot += x[i] * y[i];
+            normX += x[i] * x[i];
+            normY += y[i] * y[i];
+        }
+
+        return normX == 0 || normY == 0 ? 0 : dot / (Math.Sqrt(normX) * Math.Sqrt(normY));
+    }
+
+    private void EvictExpired(DateTimeOffset now)
+    {
+        foreach (var entry in _entries)
+        {
+            if (entry.Value.ExpiresAt <= now)
+            {
+                _entries.TryRemove(entry.Key, out _);
+            }
+        }
+    }
+
+    private static string ComputeKey(string scope, string query)
+    {
+        var normalized = $"{scope}\n{query.Trim().ToLowerInvariant()}";
+        return Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(normalized)));
+    }
+
+    private sealed record CacheEntry(string Scope, string Value, ReadOnlyMemory<float>? Embedding, DateTimeOffset ExpiresAt);
+}
+
+/// <summary>
+/// Result of a <see cref="SemanticResponseCache.LookupAsync"/> call.
+/// </summary>
+public readonly record struct CacheLookup(string Scope, string Key, ReadOnlyMemory<float>? Embedding, string? Value)
+{
+    public bool IsHit => Value != null;
+}
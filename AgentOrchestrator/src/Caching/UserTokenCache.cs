@@ -0,0 +1,203 @@
+using System.Buffers;
+using System.Collections.Concurrent;
+using System.Text.Json;
+
+namespace AgentOrchestrator.Caching;
+
+/// <summary>
+/// Caches exchanged user access tokens until shortly before they expire.
+///
+/// PERFORMANCE: Every M365 Copilot call needs a Graph token for the user. Exchanging it through
+/// the auth handler costs a round-trip to Entra ID, but the token stays valid for an hour or more,
+/// so follow-up turns from the same user can reuse it.
+///
+/// SECURITY: Entries are keyed by auth handler, tenant, user, and scopes - a token is only ever
+/// returned to the user it was issued for. Tokens are kept in memory only and never logged.
+/// </summary>
+public class UserTokenCache
+{
+    /// <summary>
+    /// Tokens are refreshed this long before they expire, so a cached token doesn't expire mid-request.
+    /// </summary>
+    private static readonly TimeSpan ExpirySkew = TimeSpan.FromSeconds(60);
+
+    private const int EvictionThreshold = 1024;
+
+    private readonly ConcurrentDictionary<string, CachedToken> _tokens = new();
+    private readonly ConcurrentDictionary<string, Lazy<Task<string>>> _inflight = new();
+    private readonly TimeProvider _timeProvider;
+
+    public UserTokenCache(TimeProvider? timeProvider = null)
+    {
+        _timeProvider = timeProvider ?? TimeProvider.System;
+    }
+
+    /// <summary>
+    /// Returns the cached token for the key, or runs the exchange and caches its result.
+    /// Tokens whose expiry can't be read are returned but not cached.
+    /// </summary>
+    /// <remarks>
+    /// PERFORMANCE: Concurrent misses for the same key (e.g. parallel M365 intents in one turn)
+    /// share a single in-flight exchange instead of each calling the auth handler.
+    /// </remarks>
+    /// <param name="key">Cache key from <see cref="CreateKey"/>.</param>
+    /// <param name="exchangeToken">Performs the token exchange on a cache miss.</param>
+    public async Task<string> GetOrExchangeAsync(string key, Func<Task<string>> exchangeToken)
+    {
+        var now = _timeProvider.GetUtcNow();
+        if (_tokens.TryGetValue(key, out var cached) && cached.ExpiresAt - ExpirySkew > now)
+        {
+            return cached.Token;
+        }
+
+        var exchange = _inflight.GetOrAdd(key, _ => new Lazy<Task<string>>(() => ExchangeAndStoreAsync(key, exchangeToken)));
+        try
+        {
+            return await exchange.Value;
+        }
+        finally
+        {
+            // Only the exchange that was awaited is removed - a newer one for the same key is left alone
+            _inflight.TryRemove(KeyValuePair.Create(key, exchange));
+        }
+    }
+
+    private async Task<string> ExchangeAndStoreAsync(string key, Func<Task<string>> exchangeToken)
+    {
+        var token = await exchangeToken();
+        var now = _timeProvider.GetUtcNow();
+
+        if (TryGetExpiry(token, out var expiresAt))
+        {
+            if (_tokens.Count >= EvictionThreshold)
+            {
+                EvictExpired(now);
+            }
+            _tokens[key] = new CachedToken(token, expiresAt);
+        }
+        else
+        {
+            _tokens.TryRemove(key, out _);
+        }
+
+        return token;
+    }
+
+    /// <summary>
+    /// Discards the cached token for the key, so the next call exchanges a new one.
+    /// </summary>
+    /// <remarks>
+    /// RELIABILITY: A token can be rejected before it expires (revocation, password reset, consent
+    /// change). Callers invalidate it when Graph returns 401/403 instead of reusing it until expiry.
+    /// </remarks>
+    public void Invalidate(string key) => _tokens.TryRemove(key, out _);
+
+    /// <summary>
+    /// Builds the cache key for a user's token.
+    /// </summary>
+    public static string CreateKey(string authHandlerName, string? tenantId, string userId, IEnumerable<string> scopes) =>
+        $"{authHandlerName}\n{tenantId}\n{userId}\n{string.Join(' ', scopes)}";
+
+    /// <summary>
+    /// Reads the expiry (exp claim) of a JWT without validating it. The token was just issued
+    /// to us by the auth handler; the expiry is only used to decide when to exchange again.
+    /// </summary>
+    /// <remarks>
+    /// PERFORMANCE: Only the payload segment is base64url-decoded into pooled buffers and scanned
+    /// for the top-level exp claim - no token object, header parsing, or claim dictionary is built.
+    /// </remarks>
+    internal static bool TryGetExpiry(string token, out DateTimeOffset expiresAt)
+    {
+        expiresAt = default;
+
+        var firstDot = token.IndexOf('.');
+        var secondDot = firstDot < 0 ? -1 : token.IndexOf('.', firstDot + 1);
+        if (secondDot < 0)
+        {
+            // Not a JWT (e.g. an opaque token) - don't cache it
+            return false;
+        }
+
+        var payload = token.AsSpan(firstDot + 1, secondDot - firstDot - 1);
+        var paddedLength = (payload.Length + 3) & ~3;
+        var chars = ArrayPool<char>.Shared.Rent(paddedLength);
+        var bytes = ArrayPool<byte>.Shared.Rent(paddedLength / 4 * 3);
+        try
+        {
+            // Base64url -> base64: swap the URL-safe characters back and restore the padding
+            for (var i = 0; i < payload.Length; i++)
+            {
+                chars[i] = payload[i] switch
+                {
+                    '-' => '+',
+                    '_' => '/',
+                    var c => c
+                };
+            }
+            chars.AsSpan(payload.Length, paddedLength - payload.Length).Fill('=');
+
+            if (!Convert.TryFromBase64Chars(chars.AsSpan(0, paddedLength), bytes, out var written))
+            {
+                return false;
+            }
+
+            return TryReadExpClaim(bytes.AsSpan(0, written), out expiresAt);
+        }
+        finally
+        {
+            ArrayPool<char>.Shared.Return(chars);
+            ArrayPool<byte>.Shared.Return(bytes);
+        }
+    }
+
+    private static bool TryReadExpClaim(ReadOnlySpan<byte> json, out DateTimeOffset expiresAt)
+    {
+        expiresAt = default;
+        var reader = new Utf8JsonReader(json);
+        try
+        {
+            if (!reader.Read() || reader.TokenType != JsonTokenType.StartObject)
+            {
+                return false;
+            }
+
+            while (reader.Read() && reader.TokenType == JsonTokenType.PropertyName)
+            {
+                var isExp = reader.ValueTextEquals("exp"u8);
+                reader.Read();
+
+                if (isExp)
+                {
+                    if (reader.TokenType != JsonTokenType.Number || !reader.TryGetInt64(out var seconds))
+                    {
+                        return false;
+                    }
+
+                    expiresAt = DateTimeOffset.FromUnixTimeSeconds(seconds);
+                    return true;
+                }
+
+                reader.Skip();
+            }
+
+            return false;
+        }
+        catch (Exception ex) when (ex is JsonException or ArgumentOutOfRangeException)
+        {
+            return false;
+        }
+    }
+
+    private void EvictExpired(DateTimeOffset now)
+    {
+        foreach (var entry in _tokens)
+        {
+            if (entry.Value.ExpiresAt <= now)
+            {
+                _tokens.TryRemove(entry.Key, out _);
+            }
+        }
+    }
+
+    private sealed record CachedToken(string Token, DateTimeOffset ExpiresAt);
+}
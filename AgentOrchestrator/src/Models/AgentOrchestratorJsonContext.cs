@@ -0,0 +1,15 @@
+using System.Text.Json.Serialization;
+
+namespace AgentOrchestrator.Models;
+
+/// <summary>
+/// Source-generated System.Text.Json metadata for the models parsed on every turn.
+///
+/// PERFORMANCE: Serialization code is generated at compile time, so parsing the intent
+/// response doesn't pay for runtime reflection or per-call JsonSerializerOptions setup.
+/// </summary>
+[JsonSourceGenerationOptions(PropertyNameCaseInsensitive = true)]
+[JsonSerializable(typeof(List<Intent>))]
+public partial class AgentOrchestratorJsonContext : JsonSerializerContext
+{
+}
@@ -2,7 +2,7 @@ using System.Text.Json.Serialization;
 
 namespace AgentOrchestrator.Models;
 
-public class AgentResponse
+public sealed class AgentResponse
 {
     [JsonPropertyName("agent")]
     public string Agent { get; set; } = string.Empty;
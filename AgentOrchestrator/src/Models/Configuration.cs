@@ -6,6 +6,7 @@ public class AzureOpenAISettings
     public string ApiKey { get; set; } = string.Empty;
     public string DeploymentName { get; set; } = "gpt-4o";
     public string ApiVersion { get; set; } = "2024-08-01-preview";
+    public string? EmbeddingDeploymentName { get; set; }
 }
 
 public class MicrosoftGraphSettings
@@ -18,5 +19,30 @@ public class OrchestrationSettings
 {
     public int MaxAgentCalls { get; set; } = 5;
     public int TimeoutSeconds { get; set; } = 30;
+    public int SynthesisReserveSeconds { get; set; } = 10;
     public bool EnableParallelExecution { get; set; } = true;
+    public bool EnableSpeculativeExecution { get; set; } = false;
+    public bool BatchM365Intents { get; set; } = true;
+    public int ConversationMemoryTurns { get; set; } = 5;
+}
+
+public class SemanticCacheSettings
+{
+    public bool Enabled { get; set; } = true;
+    public double SimilarityThreshold { get; set; } = 0.95;
+    public int TimeToLiveSeconds { get; set; } = 600;
+    public int MaxEntries { get; set; } = 1000;
+}
+
+public class HostingSettings
+{
+    public int MinWorkerThreads { get; set; } = 0;
+    public int MinCompletionPortThreads { get; set; } = 0;
+    public long? MaxConcurrentConnections { get; set; }
+}
+
+public class BlobsStorageSettings
+{
+    public string? StorageAccountName { get; set; }
+    public string ContainerName { get; set; } = "state";
 }
@@ -0,0 +1,73 @@
+using System.Text;
+using System.Text.Json.Serialization;
+
+namespace AgentOrchestrator.Models;
+
+/// <summary>
+/// Rolling memory of the most recent exchanges in a conversation.
+///
+/// Stored in conversation state so follow-up questions ("what about Friday?") can be resolved
+/// with context from earlier turns: the history is given to intent analysis (to rewrite follow-ups
+/// into self-contained sub-queries) and to synthesis.
+///
+/// SECURITY: Answers can contain the user's M365 data (emails, calendar, files) and conversation
+/// state is persisted, so only a truncated excerpt of each answer is ever stored.
+/// </summary>
+public class ConversationMemory
+{
+    public const string StateKey = "ConversationMemory";
+
+    private const int MaxAnswerLength = 500;
+
+    [JsonPropertyName("exchanges")]
+    public List<ConversationExchange> Exchanges { get; set; } = [];
+
+    /// <summary>
+    /// Records an exchange, keeping only the most recent <paramref name="maxExchanges"/>.
+    /// Answers are truncated to a short excerpt before they are stored.
+    /// </summary>
+    public void Add(string query, string answer, int maxExchanges)
+    {
+        if (answer.Length > MaxAnswerLength)
+        {
+            answer = string.Concat(answer.AsSpan(0, MaxAnswerLength), "...");
+        }
+
+        Exchanges.Add(new ConversationExchange { Query = query, Answer = answer });
+
+        if (Exchanges.Count > maxExchanges)
+        {
+            Exchanges.RemoveRange(0, Exchanges.Count - maxExchanges);
+        }
+    }
+
+    /// <summary>
+    /// Formats the remembered exchanges for a prompt.
+    /// Returns an empty string when there is no history.
+    /// </summary>
+    public string ToPromptContext()
+    {
+        if (Exchanges.Count == 0)
+        {
+            return string.Empty;
+        }
+
+        var builder = new StringBuilder();
+        foreach (var exchange in Exchanges)
+        {
+            builder.Append("User: ").AppendLine(exchange.Query);
+            builder.Append("Assistant: ").AppendLine(exchange.Answer);
+        }
+
+        return builder.ToString();
+    }
+}
+
+public class ConversationExchange
+{
+    [JsonPropertyName("query")]
+    public string Query { get; set; } = string.Empty;
+
+    [JsonPropertyName("answer")]
+    public string Answer { get; set; } = string.Empty;
+}
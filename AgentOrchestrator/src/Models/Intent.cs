@@ -2,7 +2,7 @@ using System.Text.Json.Serialization;
 
 namespace AgentOrchestrator.Models;
 
-[JsonConverter(typeof(JsonStringEnumConverter))]
+[JsonConverter(typeof(JsonStringEnumConverter<IntentType>))]
 public enum IntentType
 {
     M365Email,
@@ -12,6 +12,18 @@ public enum IntentType
     GeneralKnowledge
 }
 
+public static class IntentTypeExtensions
+{
+    // PERFORMANCE: Names are computed once instead of formatting the enum on every log/response
+    private static readonly string[] Names = Enum.GetNames<IntentType>();
+
+    /// <summary>
+    /// Gets the name of the intent type without the per-call cost of <see cref="Enum.ToString()"/>.
+    /// </summary>
+    public static string ToName(this IntentType type) =>
+        (uint)type < (uint)Names.Length ? Names[(int)type] : type.ToString();
+}
+
 public class Intent
 {
     [JsonPropertyName("type")]
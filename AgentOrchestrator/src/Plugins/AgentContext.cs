@@ -8,7 +8,11 @@ namespace AgentOrchestrator.Plugins
     /// Provides a unified context object for agent plugins, bundling the current turn context,
     /// turn state, user authorization, and the name of the authentication handler in use.
     /// </summary>
-    public class AgentContext
+    /// <remarks>
+    /// One instance is created per turn and read concurrently by parallel plugin calls, so its
+    /// properties are get-only.
+    /// </remarks>
+    public sealed class AgentContext
     {
         /// <summary>
         /// Initializes a new instance of the <see cref="AgentContext"/> class.
@@ -28,22 +32,22 @@ namespace AgentOrchestrator.Plugins
         /// <summary>
         /// Gets the current turn context providing access to activity, services, and responses.
         /// </summary>
-        public ITurnContext Context { get; private set; }
+        public ITurnContext Context { get; }
 
         /// <summary>
         /// Gets the turn-scoped state used by plugins to share data across the processing pipeline.
         /// </summary>
-        public ITurnState State { get; private set; }
+        public ITurnState State { get; }
 
         /// <summary>
         /// Gets the user's authorization information for the current request.
         /// </summary>
-        public UserAuthorization UserAuth { get; private set; }
+        public UserAuthorization UserAuth { get; }
 
         /// <summary>
         /// Gets the name of the authentication handler used to produce the <see cref="UserAuthorization"/>.
         /// </summary>
-        public string AuthHandlerName { get; private set; }
+        public string AuthHandlerName { get; }
 
     }
 }
@@ -0,0 +1,30 @@
+namespace AgentOrchestrator.Plugins;
+
+/// <summary>
+/// Provides access to the <see cref="AgentContext"/> of the turn currently being processed.
+/// </summary>
+/// <remarks>
+/// Works like <c>IHttpContextAccessor</c>: the value is stored in an <see cref="AsyncLocal{T}"/>
+/// and flows with the async call chain of the turn. This lets plugins be created and registered
+/// with the kernel once at startup while still seeing the per-turn context when they're invoked.
+/// </remarks>
+public class AgentContextAccessor
+{
+    private static readonly AsyncLocal<AgentContext?> CurrentContext = new();
+
+    /// <summary>
+    /// Gets or sets the <see cref="AgentContext"/> for the current turn, or null outside of a turn.
+    /// </summary>
+    public AgentContext? AgentContext
+    {
+        get => CurrentContext.Value;
+        set => CurrentContext.Value = value;
+    }
+
+    /// <summary>
+    /// Gets the <see cref="AgentContext"/> for the current turn.
+    /// </summary>
+    /// <exception cref="InvalidOperationException">Thrown when called outside of a turn.</exception>
+    public AgentContext GetRequiredAgentContext() =>
+        CurrentContext.Value ?? throw new InvalidOperationException("No AgentContext is set for the current turn.");
+}
@@ -5,25 +5,29 @@ namespace AgentOrchestrator.Plugins;
 
 public class AzureOpenAIPlugin
 {
-    private readonly Kernel _kernel;
+    private readonly AgentContextAccessor _contextAccessor;
     private readonly ILogger<AzureOpenAIPlugin>? _logger;
-    private readonly AgentContext _context;
 
-    public AzureOpenAIPlugin(AgentContext agentContext, Kernel kernel, ILogger<AzureOpenAIPlugin>? logger = null)
+    public AzureOpenAIPlugin(AgentContextAccessor contextAccessor, ILogger<AzureOpenAIPlugin>? logger = null)
     {
-        _context = agentContext;
-        _kernel = kernel;
+        _contextAccessor = contextAccessor;
         _logger = logger;
     }
 
     [KernelFunction]
     [Description("Answers general knowledge questions that are not related to Microsoft 365 data")]
     public async Task<string> GeneralKnowledgeAsync(
+        Kernel kernel,
         [Description("The general knowledge question to answer")] string query,
         CancellationToken cancellationToken = default)
     {
-        _logger?.LogInformation("Processing general knowledge query: {Query}", query);
-        await _context.Context.StreamingResponse.QueueInformativeUpdateAsync("Contacting Azure OpenAI...");
+        if (_logger?.IsEnabled(LogLevel.Information) == true)
+        {
+            _logger.LogInformation("Processing general knowledge query: {Query}", QueryLogging.Truncate(query));
+        }
+
+        var context = _contextAccessor.GetRequiredAgentContext();
+        await context.Context.StreamingResponse.QueueInformativeUpdateAsync("Contacting Azure OpenAI...");
         var prompt = $"""
             You are a helpful AI assistant. Answer the following question clearly and concisely.
 
@@ -33,7 +37,7 @@ public class AzureOpenAIPlugin
             include relevant details and examples where appropriate.
             """;
 
-        var result = await _kernel.InvokePromptAsync(prompt, cancellationToken: cancellationToken);
+        var result = await kernel.InvokePromptAsync(prompt, cancellationToken: cancellationToken);
         return result.GetValue<string>() ?? "I couldn't generate a response.";
     }
 }
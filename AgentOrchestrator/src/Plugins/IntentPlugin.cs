@@ -5,26 +5,30 @@ namespace AgentOrchestrator.Plugins;
 
 public class IntentPlugin
 {
-    private readonly Kernel _kernel;
+    private readonly AgentContextAccessor _contextAccessor;
     private readonly ILogger<IntentPlugin>? _logger;
-    private readonly AgentContext _context;
 
-    public IntentPlugin(AgentContext agentContext, Kernel kernel, ILogger<IntentPlugin>? logger = null)
+    public IntentPlugin(AgentContextAccessor contextAccessor, ILogger<IntentPlugin>? logger = null)
     {
-        _context = agentContext;
-        _kernel = kernel;
+        _contextAccessor = contextAccessor;
         _logger = logger;
     }
 
     [KernelFunction]
     [Description("Analyzes a user query to identify intent types for routing to appropriate agents")]
     public async Task<string> AnalyzeIntentAsync(
+        Kernel kernel,
         [Description("The user's query to analyze")] string query,
+        [Description("Recent exchanges in the conversation, for resolving follow-up questions")] string history = "",
         CancellationToken cancellationToken = default)
     {
-        _logger?.LogInformation("Analyzing intent for query: {Query}", query);
+        if (_logger?.IsEnabled(LogLevel.Information) == true)
+        {
+            _logger.LogInformation("Analyzing intent for query: {Query}", QueryLogging.Truncate(query));
+        }
         
-        await _context.Context.StreamingResponse.QueueInformativeUpdateAsync("Analyzing intent...");
+        var context = _contextAccessor.GetRequiredAgentContext();
+        await context.Context.StreamingResponse.QueueInformativeUpdateAsync("Analyzing intent...");
 
         var prompt = $$"""
             You are an intent classifier for a multi-agent system. Analyze the user's query and identify which agents should handle it.
@@ -41,6 +45,11 @@ public class IntentPlugin
             2. If the query mentions personal data (my emails, my calendar, my files, my team), route to the appropriate M365 intent
             3. If the query is about general concepts, technology, or information not in M365, use GeneralKnowledge
             4. Extract the relevant sub-query for each intent
+            5. If the query is a follow-up (e.g. "what about Friday?"), use the recent conversation to classify it
+               and rewrite each sub-query so it can be answered on its own
+
+            Recent Conversation:
+            {{(string.IsNullOrEmpty(history) ? "(none)" : history)}}
 
             User Query: {{query}}
 
@@ -56,7 +65,7 @@ public class IntentPlugin
             ]
             """;
 
-        var result = await _kernel.InvokePromptAsync(prompt, cancellationToken: cancellationToken);
+        var result = await kernel.InvokePromptAsync(prompt, cancellationToken: cancellationToken);
         var response = result.GetValue<string>() ?? "[]";
 
         // Clean up response - extract JSON if wrapped in markdown
@@ -67,26 +76,35 @@ public class IntentPlugin
 
     private static string ExtractJson(string response)
     {
+        // PERFORMANCE: Ordinal span searches and slicing (string.IndexOf(string) is culture-aware),
+        // and only the final trimmed JSON is allocated (none at all when nothing needs stripping)
+        var json = response.AsSpan();
+
         // Remove markdown code blocks if present
-        if (response.Contains("```json"))
+        var start = json.IndexOf("```json", StringComparison.Ordinal);
+        if (start >= 0)
         {
-            var start = response.IndexOf("```json") + 7;
-            var end = response.LastIndexOf("```");
-            if (end > start)
+            start += 7;
+        }
+        else
+        {
+            start = json.IndexOf("```", StringComparison.Ordinal);
+            if (start >= 0)
             {
-                response = response[start..end];
+                start += 3;
             }
         }
-        else if (response.Contains("```"))
+
+        if (start >= 0)
         {
-            var start = response.IndexOf("```") + 3;
-            var end = response.LastIndexOf("```");
+            var end = json.LastIndexOf("```", StringComparison.Ordinal);
             if (end > start)
             {
-                response = response[start..end];
+                json = json[start..end];
             }
         }
 
-        return response.Trim();
+        json = json.Trim();
+        return json.Length == response.Length ? response : json.ToString();
     }
 }
@@ -1,8 +1,10 @@
 //using AgentOrchestrator.CopilotSdk;
+using AgentOrchestrator.Caching;
 using AgentOrchestrator.Models;
 using Microsoft.Agents.M365Copilot.Beta;
 using Microsoft.Agents.M365Copilot.Beta.Copilot.Conversations.Item.MicrosoftGraphCopilotChat;
 using Microsoft.Agents.M365Copilot.Beta.Models;
+using Microsoft.Kiota.Abstractions;
 using Microsoft.Kiota.Abstractions.Authentication;
 using Microsoft.Kiota.Http.HttpClientLibrary;
 using Microsoft.SemanticKernel;
@@ -31,36 +33,45 @@ namespace AgentOrchestrator.Plugins;
 /// </summary>
 public class M365CopilotPlugin
 {
-    private readonly AgentContext _context;
+    private readonly AgentContextAccessor _contextAccessor;
     private readonly IHttpClientFactory _httpClientFactory;
     private readonly MicrosoftGraphSettings _graphSettings;
+    private readonly UserTokenCache _tokenCache;
     private readonly ILogger<M365CopilotPlugin> _logger;
-    private readonly List<string> requiredScopesList = new()
-    {
-            "openid",
-            "profile",
-            "email",
-            "User.Read",
-            "Mail.Read",
-            "Calendars.Read",
-            "Files.Read.All",
-            "Sites.Read.All",
-            "People.Read.All",
-            "Chat.Read",
-            "OnlineMeetingTranscript.Read.All",
-            "ChannelMessage.Read.All",
-            "ExternalItem.Read.All"
-    };
+
+    private const string ConversationIdStateKey = "M365CopilotConversationId";
+    private static readonly SemaphoreSlim[] ConversationLocks =
+        Enumerable.Range(0, 64).Select(_ => new SemaphoreSlim(1, 1)).ToArray();
+
+    // PERFORMANCE: Scopes are fixed, so they're built once for all plugin calls and token cache keys
+    private static readonly string[] RequiredScopes =
+    [
+        "openid",
+        "profile",
+        "email",
+        "User.Read",
+        "Mail.Read",
+        "Calendars.Read",
+        "Files.Read.All",
+        "Sites.Read.All",
+        "People.Read.All",
+        "Chat.Read",
+        "OnlineMeetingTranscript.Read.All",
+        "ChannelMessage.Read.All",
+        "ExternalItem.Read.All"
+    ];
 
     public M365CopilotPlugin(
-        AgentContext agentContext,
+        AgentContextAccessor contextAccessor,
         IHttpClientFactory httpClientFactory,
         MicrosoftGraphSettings graphSettings,
+        UserTokenCache tokenCache,
         ILogger<M365CopilotPlugin> logger)
     {
-        _context = agentContext;
+        _contextAccessor = contextAccessor;
         _httpClientFactory = httpClientFactory;
         _graphSettings = graphSettings;
+        _tokenCache = tokenCache;
         _logger = logger;
     }
 
@@ -100,39 +111,50 @@ public class M365CopilotPlugin
         return await CallCopilotChatApiAsync(query, cancellationToken);
     }
 
+    [KernelFunction]
+    [Description("Query Microsoft 365 Copilot with several related questions in a single Chat API call")]
+    public async Task<string> QueryBatchAsync(
+        [Description("The questions to ask, one per entry")] string[] queries,
+        CancellationToken cancellationToken = default)
+    {
+        if (queries.Length == 1)
+        {
+            return await CallCopilotChatApiAsync(queries[0], cancellationToken);
+        }
+
+        // PERFORMANCE: One chat message instead of one per question - a single token exchange,
+        // conversation lookup and Copilot round-trip for the whole batch.
+        var message = "Answer each of the following questions separately, using the question as a heading:\n" +
+            string.Join("\n", queries.Select((query, index) => $"{index + 1}. {query}"));
+
+        return await CallCopilotChatApiAsync(message, cancellationToken);
+    }
+
     private async Task<string> CallCopilotChatApiAsync(
         string query,
         CancellationToken cancellationToken)
     {
-        _logger.LogInformation("Calling Copilot Chat API with query: {Query}", query);
+        if (_logger.IsEnabled(LogLevel.Information))
+        {
+            _logger.LogInformation("Calling Copilot Chat API with query: {Query}", QueryLogging.Truncate(query));
+        }
 
-        await _context.Context.StreamingResponse.QueueInformativeUpdateAsync("Contacting Microsoft 365 Copilot...");
+        var context = _contextAccessor.GetRequiredAgentContext();
+        await context.Context.StreamingResponse.QueueInformativeUpdateAsync("Contacting Microsoft 365 Copilot...");
 
         // Create Kiota client with user's access token
-        var client = await CreateCopilotClientAsync();
-        string? conversationId = _context.State.Conversation.GetValue<string>("M365CopilotConversationId");
+        var tokenCacheKey = GetTokenCacheKey(context);
+        var client = await CreateCopilotClientAsync(context, tokenCacheKey);
+        string? conversationId = null;
 
         try
         {
-            if (string.IsNullOrEmpty(conversationId))
-            {
-                // Step 1: Create conversation
-                _logger.LogInformation("Creating conversation...");
-                var conversation = await client.Copilot.Conversations.PostAsync(
-                    new CopilotConversation(),
-                    cancellationToken: cancellationToken);
-
-                if (conversation?.Id == null)
-                {
-                    throw new InvalidOperationException("Failed to create conversation - no ID returned");
-                }
-                conversationId = conversation.Id;
-                _context.State.Conversation.SetValue<string>("M365CopilotConversationId",conversationId);
-            }
+            // Step 1: Create conversation (or reuse this chat's existing one)
+            conversationId = await GetOrCreateConversationIdAsync(client, context, cancellationToken);
             _logger.LogInformation("Created conversation: {ConversationId}", conversationId);
 
             // Step 2: Send chat message
-            await _context.Context.StreamingResponse.QueueInformativeUpdateAsync("Talking to Microsoft 365 Copilot...");
+            await context.Context.StreamingResponse.QueueInformativeUpdateAsync("Talking to Microsoft 365 Copilot...");
             var chatRequest = new ChatPostRequestBody()
             {
                 Message = new CopilotConversationRequestMessageParameter()
@@ -178,6 +200,18 @@ public class M365CopilotPlugin
         //    _logger.LogError(ex, "Server error from Copilot API");
         //    return "The Copilot service encountered an error. Please try again later.";
         //}
+        catch (ApiException ex) when (ex.ResponseStatusCode is 401 or 403)
+        {
+            // RELIABILITY: The cached token was rejected (e.g. revoked or consent changed) - drop it
+            // so the next call exchanges a new one instead of failing until it expires
+            if (tokenCacheKey != null)
+            {
+                _tokenCache.Invalidate(tokenCacheKey);
+            }
+
+            _logger.LogError(ex, "Copilot Chat API rejected the user's token ({StatusCode})", ex.ResponseStatusCode);
+            throw;
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error calling Copilot Chat API");
@@ -195,16 +229,77 @@ public class M365CopilotPlugin
         }
     }
 
-    private async Task<AgentsM365CopilotBetaServiceClient> CreateCopilotClientAsync()
+    private async Task<string> GetOrCreateConversationIdAsync(
+        AgentsM365CopilotBetaServiceClient client,
+        AgentContext context,
+        CancellationToken cancellationToken)
+    {
+        // RELIABILITY: Parallel M365 intents in the same turn share one Copilot conversation.
+        // Without the lock they'd each see no ID yet and create (and overwrite) their own.
+        var conversationLock = GetConversationLock(context.Context.Activity.Conversation?.Id);
+        await conversationLock.WaitAsync(cancellationToken);
+        try
+        {
+            var conversationId = context.State.Conversation.GetValue<string>(ConversationIdStateKey);
+            if (!string.IsNullOrEmpty(conversationId))
+            {
+                return conversationId;
+            }
+
+            _logger.LogInformation("Creating conversation...");
+            var conversation = await client.Copilot.Conversations.PostAsync(
+                new CopilotConversation(),
+                cancellationToken: cancellationToken);
+
+            if (conversation?.Id == null)
+            {
+                throw new InvalidOperationException("Failed to create conversation - no ID returned");
+            }
+
+            context.State.Conversation.SetValue<string>(ConversationIdStateKey, conversation.Id);
+            return conversation.Id;
+        }
+        finally
+        {
+            conversationLock.Release();
+        }
+    }
+
+    /// <summary>
+    /// PERFORMANCE: Lock striping - each chat maps to one of a fixed set of locks, so different
+    /// conversations rarely wait on each other and no per-conversation lock has to be tracked or cleaned up.
+    /// </summary>
+    private static SemaphoreSlim GetConversationLock(string? conversationId) =>
+        ConversationLocks[(uint)StringComparer.Ordinal.GetHashCode(conversationId ?? string.Empty) % (uint)ConversationLocks.Length];
+
+    /// <summary>
+    /// Returns the user's token cache key, or null when the activity doesn't identify the user
+    /// (the token is then exchanged on every call and never cached).
+    /// </summary>
+    private static string? GetTokenCacheKey(AgentContext context)
+    {
+        var activity = context.Context.Activity;
+        var userId = activity.From?.AadObjectId ?? activity.From?.Id;
+        return string.IsNullOrEmpty(userId)
+            ? null
+            : UserTokenCache.CreateKey(context.AuthHandlerName, activity.Conversation?.TenantId, userId, RequiredScopes);
+    }
+
+    private async Task<AgentsM365CopilotBetaServiceClient> CreateCopilotClientAsync(AgentContext context, string? tokenCacheKey)
     {
         // Create HTTP client
         var httpClient = _httpClientFactory.CreateClient("Graph");
 
         // Create authentication provider with user's token
-        var userToken = await _context.UserAuth.ExchangeTurnTokenAsync(
-                    _context.Context,
-                    _context.AuthHandlerName,
-                    exchangeScopes: requiredScopesList).ConfigureAwait(false); 
+        // PERFORMANCE: Reuse the user's exchanged token across turns until it's about to expire
+        Task<string> ExchangeTokenAsync() => context.UserAuth.ExchangeTurnTokenAsync(
+            context.Context,
+            context.AuthHandlerName,
+            exchangeScopes: RequiredScopes);
+
+        var userToken = tokenCacheKey == null
+            ? await ExchangeTokenAsync().ConfigureAwait(false)
+            : await _tokenCache.GetOrExchangeAsync(tokenCacheKey, ExchangeTokenAsync).ConfigureAwait(false);
         var authProvider = new BaseBearerTokenAuthenticationProvider(
             new TokenProvider(userToken));
 
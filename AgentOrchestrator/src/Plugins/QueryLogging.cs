@@ -0,0 +1,20 @@
+namespace AgentOrchestrator.Plugins;
+
+/// <summary>
+/// Bounds user queries before they are written to the logs.
+/// </summary>
+/// <remarks>
+/// SECURITY / PERFORMANCE: Messages can be up to 4000 characters and may contain the user's own
+/// data. Logging only a prefix keeps log entries small while still identifying the request.
+/// </remarks>
+internal static class QueryLogging
+{
+    internal const int MaxLoggedQueryLength = 200;
+
+    /// <summary>
+    /// Returns the query, truncated to <see cref="MaxLoggedQueryLength"/> characters.
+    /// Short queries are returned as-is without allocating.
+    /// </summary>
+    public static string Truncate(string query) =>
+        query.Length > MaxLoggedQueryLength ? string.Concat(query.AsSpan(0, MaxLoggedQueryLength), "...") : query;
+}
@@ -1,55 +1,113 @@
+using AgentOrchestrator.Models;
 using Microsoft.SemanticKernel;
+using System.Buffers;
 using System.ComponentModel;
+using System.Runtime.CompilerServices;
+using System.Text;
+using System.Text.Json;
 
 namespace AgentOrchestrator.Plugins;
 
 public class SynthesisPlugin
 {
-    private readonly Kernel _kernel;
+    private readonly AgentContextAccessor _contextAccessor;
     private readonly ILogger<SynthesisPlugin>? _logger;
-    private readonly AgentContext _context;
 
-    public SynthesisPlugin(AgentContext agentContext, Kernel kernel, ILogger<SynthesisPlugin>? logger = null)
+    /// <summary>
+    /// PERFORMANCE: The instructions are identical for every call, so they come first and the
+    /// per-request parts (history, query, responses) last. Azure OpenAI prompt caching can then
+    /// reuse the already-processed prefix instead of recomputing it on each synthesis.
+    /// </summary>
+    private const string SynthesisPromptPrefix = """
+        You are a response synthesizer. Your job is to combine multiple agent responses into a single,
+        coherent response that addresses the user's original query.
+
+        Instructions:
+        1. Analyze all the agent responses
+        2. Combine them into a single, well-organized response
+        3. Maintain clear structure - if there are multiple topics, organize them with headers or clear transitions
+        4. Remove any redundancy between responses
+        5. Ensure the response directly addresses the user's original query, using the recent conversation only to resolve follow-up references
+        6. Keep the tone helpful and conversational
+        7. If one response is about M365 data (emails, calendar, etc.) and another is general knowledge,
+           present the M365 data first, then the general information
+
+
+        """;
+
+    public SynthesisPlugin(AgentContextAccessor contextAccessor, ILogger<SynthesisPlugin>? logger = null)
     {
-        _context = agentContext;
-        _kernel = kernel;
+        _contextAccessor = contextAccessor;
         _logger = logger;
     }
 
     [KernelFunction]
     [Description("Synthesizes multiple agent responses into a coherent unified response")]
-    public async Task<string> SynthesizeAsync(
+    public async IAsyncEnumerable<string> SynthesizeAsync(
+        Kernel kernel,
         [Description("The original user query")] string originalQuery,
         [Description("JSON array of agent responses to synthesize")] string responses,
-        CancellationToken cancellationToken = default)
+        [Description("Recent exchanges in the conversation, for context on follow-up questions")] string history = "",
+        [EnumeratorCancellation] CancellationToken cancellationToken = default)
     {
-        _logger?.LogInformation("Synthesizing responses for query: {Query}", originalQuery);
-        
-        await _context.Context.StreamingResponse.QueueInformativeUpdateAsync("Synthesizing responses...");
+        // PERFORMANCE: Queries can be up to the agent's message limit - log a bounded prefix,
+        // and only build it when Information logging is on
+        if (_logger?.IsEnabled(LogLevel.Information) == true)
+        {
+            _logger.LogInformation("Synthesizing responses for query: {Query}", QueryLogging.Truncate(originalQuery));
+        }
+
+        var context = _contextAccessor.GetRequiredAgentContext();
+        await context.Context.StreamingResponse.QueueInformativeUpdateAsync("Synthesizing responses...");
 
-        var prompt = $"""
-            You are a response synthesizer. Your job is to combine multiple agent responses into a single,
-            coherent response that addresses the user's original query.
+        var prompt = SynthesisPromptPrefix + $"""
+            Recent Conversation:
+            {(string.IsNullOrEmpty(history) ? "(none)" : history)}
 
             Original User Query: {originalQuery}
 
             Agent Responses:
             {responses}
 
-            Instructions:
-            1. Analyze all the agent responses
-            2. Combine them into a single, well-organized response
-            3. Maintain clear structure - if there are multiple topics, organize them with headers or clear transitions
-            4. Remove any redundancy between responses
-            5. Ensure the response directly addresses the user's original query
-            6. Keep the tone helpful and conversational
-            7. If one response is about M365 data (emails, calendar, etc.) and another is general knowledge,
-               present the M365 data first, then the general information
-
             Synthesized Response:
             """;
 
-        var result = await _kernel.InvokePromptAsync(prompt, cancellationToken: cancellationToken);
-        return result.GetValue<string>() ?? "I couldn't synthesize a response.";
+        // PERFORMANCE: Stream the completion so callers can forward text as soon as the first tokens arrive
+        var synthesizedLength = 0;
+        await foreach (var chunk in kernel.InvokePromptStreamingAsync<string>(prompt, cancellationToken: cancellationToken))
+        {
+            synthesizedLength += chunk?.Length ?? 0;
+            yield return chunk;
+        }
+
+        _logger?.LogInformation("Synthesized response of length {Length}", synthesizedLength);
+    }
+
+    /// <summary>
+    /// Formats agent responses as the JSON array passed to <see cref="SynthesizeAsync"/>:
+    /// <c>[{"agent":"...","content":"..."}]</c>.
+    /// </summary>
+    /// <remarks>
+    /// PERFORMANCE: Writes directly with <see cref="Utf8JsonWriter"/> instead of serializing
+    /// projected anonymous objects, which needs reflection-based metadata for each anonymous type
+    /// and an extra object per response. Pure over its input, so it's safe to call concurrently.
+    /// </remarks>
+    public static string FormatResponsesForSynthesis(IEnumerable<AgentResponse> responses)
+    {
+        var buffer = new ArrayBufferWriter<byte>();
+        using (var writer = new Utf8JsonWriter(buffer))
+        {
+            writer.WriteStartArray();
+            foreach (var response in responses)
+            {
+                writer.WriteStartObject();
+                writer.WriteString("agent", response.Agent);
+                writer.WriteString("content", response.Content);
+                writer.WriteEndObject();
+            }
+            writer.WriteEndArray();
+        }
+
+        return Encoding.UTF8.GetString(buffer.WrittenSpan);
     }
 }
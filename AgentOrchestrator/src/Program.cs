@@ -1,9 +1,16 @@
 using AgentOrchestrator;
 using AgentOrchestrator.Agent;
+using AgentOrchestrator.Caching;
+using AgentOrchestrator.Constants;
 using AgentOrchestrator.Models;
+using AgentOrchestrator.Plugins;
+using Azure.Identity;
+using Azure.Storage;
 using Microsoft.Agents.Builder;
 using Microsoft.Agents.Hosting.AspNetCore;
 using Microsoft.Agents.Storage;
+using Microsoft.Agents.Storage.Blobs;
+using Microsoft.Extensions.AI;
 using Microsoft.SemanticKernel;
 using System.Threading.RateLimiting;
 
@@ -28,10 +35,20 @@ var graphSettings = builder.Configuration.GetSection("MicrosoftGraph").Get<Micro
 var orchestrationSettings = builder.Configuration.GetSection("Orchestration").Get<OrchestrationSettings>()
     ?? new OrchestrationSettings();
 
+var semanticCacheSettings = builder.Configuration.GetSection("SemanticCache").Get<SemanticCacheSettings>()
+    ?? new SemanticCacheSettings();
+
+var hostingSettings = builder.Configuration.GetSection("Hosting").Get<HostingSettings>()
+    ?? new HostingSettings();
+
+var blobsStorageSettings = builder.Configuration.GetSection("BlobsStorageOptions").Get<BlobsStorageSettings>()
+    ?? new BlobsStorageSettings();
+
 // Register configuration as singletons
 builder.Services.AddSingleton(azureOpenAISettings);
 builder.Services.AddSingleton(graphSettings);
 builder.Services.AddSingleton(orchestrationSettings);
+builder.Services.AddSingleton(semanticCacheSettings);
 
 // ============================================================================
 // SESSION MANAGEMENT
@@ -67,6 +84,36 @@ builder.Services.AddSession(options =>
 
 builder.Services.AddHttpContextAccessor();
 
+// ============================================================================
+// THREAD POOL & CONNECTION LIMITS
+// ============================================================================
+// PERFORMANCE: Kestrel already serves requests on every core from one process,
+// so there is no worker count to raise. What limits burst throughput is the
+// thread pool: it starts with one thread per core and only adds threads
+// gradually, so any synchronous waits inside SDK calls queue up behind each
+// other under load. Raising the minimum lets the pool grow immediately.
+//
+// Configure with Hosting:MinWorkerThreads / Hosting:MinCompletionPortThreads
+// (env: Hosting__MinWorkerThreads). Values below the runtime default are ignored.
+// Hosting:MaxConcurrentConnections caps open Kestrel connections (default: unlimited).
+//
+// NOTE: On Windows App Service (infra/modules/webapp.bicep) the app runs in-process
+// behind IIS, so Kestrel isn't the server and the connection limit has no effect
+// there - IIS applies its own limits. It applies when Kestrel serves directly:
+// local development, Linux App Service, and containers. The thread pool minimums
+// apply in every hosting model.
+// ============================================================================
+ThreadPool.GetMinThreads(out var minWorkerThreads, out var minCompletionPortThreads);
+ThreadPool.SetMinThreads(
+    Math.Max(minWorkerThreads, hostingSettings.MinWorkerThreads),
+    Math.Max(minCompletionPortThreads, hostingSettings.MinCompletionPortThreads));
+
+// Kestrel only - not used when hosted in-process by IIS
+builder.WebHost.ConfigureKestrel(options =>
+{
+    options.Limits.MaxConcurrentConnections = hostingSettings.MaxConcurrentConnections;
+});
+
 // ============================================================================
 // HTTP CLIENT WITH RESILIENCE
 // ============================================================================
@@ -95,23 +142,88 @@ builder.Services.AddHttpClient("Graph")
         options.TotalRequestTimeout.Timeout = TimeSpan.FromSeconds(120);
     });
 
+// PERFORMANCE: One long-lived connection pool for all Azure OpenAI calls (chat and embeddings).
+// The kernel is a singleton, so it keeps this client for the app's lifetime; the handler is
+// never rotated and PooledConnectionLifetime recycles connections instead, so DNS changes are
+// still picked up without paying a new TCP/TLS handshake on every turn.
+builder.Services.AddHttpClient("AzureOpenAI")
+    .ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+    {
+        PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+        EnableMultipleHttp2Connections = true
+    })
+    .SetHandlerLifetime(Timeout.InfiniteTimeSpan);
+
 // === Semantic Kernel Setup ===
+// Plugins read the per-turn AgentContext from this accessor, so they can be registered once
+builder.Services.AddSingleton<AgentContextAccessor>();
+
+// Exchanged user tokens are reused across turns until shortly before they expire
+builder.Services.AddSingleton<UserTokenCache>();
+
 builder.Services.AddSingleton<Kernel>(sp =>
 {
     var kernelBuilder = Kernel.CreateBuilder();
+    var azureOpenAIHttpClient = sp.GetRequiredService<IHttpClientFactory>().CreateClient("AzureOpenAI");
 
     kernelBuilder.AddAzureOpenAIChatCompletion(
         deploymentName: azureOpenAISettings.DeploymentName,
         endpoint: azureOpenAISettings.Endpoint,
-        apiKey: azureOpenAISettings.ApiKey
+        apiKey: azureOpenAISettings.ApiKey,
+        httpClient: azureOpenAIHttpClient
     );
 
+    // Optional embedding model enables similarity (paraphrase) hits in the semantic cache
+    if (!string.IsNullOrEmpty(azureOpenAISettings.EmbeddingDeploymentName))
+    {
+#pragma warning disable SKEXP0010 // Embedding generator registration is experimental
+        kernelBuilder.AddAzureOpenAIEmbeddingGenerator(
+            deploymentName: azureOpenAISettings.EmbeddingDeploymentName,
+            endpoint: azureOpenAISettings.Endpoint,
+            apiKey: azureOpenAISettings.ApiKey,
+            httpClient: azureOpenAIHttpClient
+        );
+#pragma warning restore SKEXP0010
+    }
+
     // Build kernel
     var kernel = kernelBuilder.Build();
 
     // Get logger factory for plugin logging
     var loggerFactory = sp.GetRequiredService<ILoggerFactory>();
 
+    // PERFORMANCE: Register plugins once - Semantic Kernel reflects over each plugin's
+    // [KernelFunction] methods on registration, which is wasted work if repeated per turn.
+    var agentContextAccessor = sp.GetRequiredService<AgentContextAccessor>();
+    kernel.Plugins.AddFromObject(
+        new IntentPlugin(agentContextAccessor, loggerFactory.CreateLogger<IntentPlugin>()),
+        PluginNames.Intent);
+    kernel.Plugins.AddFromObject(
+        new M365CopilotPlugin(
+            agentContextAccessor,
+            sp.GetRequiredService<IHttpClientFactory>(),
+            graphSettings,
+            sp.GetRequiredService<UserTokenCache>(),
+            loggerFactory.CreateLogger<M365CopilotPlugin>()),
+        PluginNames.M365Copilot);
+    kernel.Plugins.AddFromObject(
+        new AzureOpenAIPlugin(agentContextAccessor, loggerFactory.CreateLogger<AzureOpenAIPlugin>()),
+        PluginNames.AzureOpenAI);
+    kernel.Plugins.AddFromObject(
+        new SynthesisPlugin(agentContextAccessor, loggerFactory.CreateLogger<SynthesisPlugin>()),
+        PluginNames.Synthesis);
+
+    // PERFORMANCE: Serve repeated intent/general knowledge queries without an LLM round-trip
+    if (semanticCacheSettings.Enabled)
+    {
+        var cache = new SemanticResponseCache(
+            semanticCacheSettings,
+            kernel.Services.GetService<IEmbeddingGenerator<string, Embedding<float>>>());
+        kernel.FunctionInvocationFilters.Add(
+            new SemanticCacheFilter(cache, loggerFactory.CreateLogger<SemanticCacheFilter>()));
+    }
+
+    // The kernel is shared by all concurrent turns - treat it as read-only from here on
     return kernel;
 });
 
@@ -119,10 +231,25 @@ builder.Services.AddSingleton<Kernel>(sp =>
 builder.Services.AddAgentAspNetAuthentication(builder.Configuration);
 
 // === M365 Agents SDK Setup ===
-// LAB SIMPLIFICATION: MemoryStorage stores conversation state in-memory.
-// State is lost on app restart. For production, implement IStorage with
-// Azure Cosmos DB, SQL Server, or Azure Blob Storage.
-builder.Services.AddSingleton<IStorage, MemoryStorage>();
+// Conversation state (Copilot conversation ID, conversation memory) lives in IStorage.
+// - Azure deployments: Blob Storage in the account provisioned by infra/ (BlobsStorageOptions),
+//   so state survives restarts and is shared when the app scales out to several instances
+// - Local development: MemoryStorage - state is lost on app restart
+// PERFORMANCE: The Agents SDK loads each state scope once at the start of a turn and saves all
+// changes in one write at the end, so plugins updating state don't each cost a storage round-trip.
+if (!string.IsNullOrEmpty(blobsStorageSettings.StorageAccountName))
+{
+    // SECURITY: Managed identity (AZURE_CLIENT_ID) instead of a connection string - the storage
+    // account doesn't allow shared key access.
+    var containerUri = new Uri(
+        $"https://{blobsStorageSettings.StorageAccountName}.blob.core.windows.net/{blobsStorageSettings.ContainerName}");
+    builder.Services.AddSingleton<IStorage>(
+        new BlobsStorage(containerUri, new DefaultAzureCredential(), new StorageTransferOptions()));
+}
+else
+{
+    builder.Services.AddSingleton<IStorage, MemoryStorage>();
+}
 
 // Add AgentApplicationOptions from configuration
 builder.AddAgentApplicationOptions();
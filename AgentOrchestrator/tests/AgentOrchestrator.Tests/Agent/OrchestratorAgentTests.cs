@@ -1,4 +1,6 @@
+using AgentOrchestrator.Agent;
 using AgentOrchestrator.Models;
+using Microsoft.Extensions.Logging.Abstractions;
 using System.Text.Json;
 using Xunit;
 
@@ -6,6 +8,12 @@ namespace AgentOrchestrator.Tests.Agent;
 
 public class OrchestratorAgentTests
 {
+    // Shared across tests - each new JsonSerializerOptions instance rebuilds its type metadata cache
+    private static readonly JsonSerializerOptions CaseInsensitiveOptions = new()
+    {
+        PropertyNameCaseInsensitive = true
+    };
+
     [Fact]
     public void Intent_Deserialization_ShouldWorkCorrectly()
     {
@@ -18,10 +26,7 @@ public class OrchestratorAgentTests
             """;
 
         // Act
-        var intents = JsonSerializer.Deserialize<List<Intent>>(json, new JsonSerializerOptions
-        {
-            PropertyNameCaseInsensitive = true
-        });
+        var intents = JsonSerializer.Deserialize<List<Intent>>(json, CaseInsensitiveOptions);
 
         // Assert
         Assert.NotNull(intents);
@@ -31,6 +36,22 @@ public class OrchestratorAgentTests
         Assert.Equal(IntentType.GeneralKnowledge, intents[1].Type);
     }
 
+    [Fact]
+    public void Intent_SourceGeneratedDeserialization_ShouldIgnoreCase()
+    {
+        // Arrange
+        var json = """[{"Type": "M365Calendar", "Query": "meetings tomorrow"}]""";
+
+        // Act
+        var intents = JsonSerializer.Deserialize(json, AgentOrchestratorJsonContext.Default.ListIntent);
+
+        // Assert
+        Assert.NotNull(intents);
+        Assert.Single(intents);
+        Assert.Equal(IntentType.M365Calendar, intents[0].Type);
+        Assert.Equal("meetings tomorrow", intents[0].Query);
+    }
+
     [Fact]
     public void Intent_IsM365Intent_ShouldReturnCorrectly()
     {
@@ -42,6 +63,15 @@ public class OrchestratorAgentTests
         Assert.False(new Intent { Type = IntentType.GeneralKnowledge }.IsM365Intent);
     }
 
+    [Fact]
+    public void IntentType_ToName_ShouldMatchToString()
+    {
+        foreach (var type in Enum.GetValues<IntentType>())
+        {
+            Assert.Equal(type.ToString(), type.ToName());
+        }
+    }
+
     [Fact]
     public void AgentResponse_Serialization_ShouldWorkCorrectly()
     {
@@ -65,6 +95,132 @@ public class OrchestratorAgentTests
         Assert.True(deserialized.Success);
     }
 
+    [Fact]
+    public void ConversationMemory_Add_ShouldKeepMostRecentExchanges()
+    {
+        // Arrange
+        var memory = new ConversationMemory();
+
+        // Act
+        memory.Add("first", "one", maxExchanges: 2);
+        memory.Add("second", "two", maxExchanges: 2);
+        memory.Add("third", "three", maxExchanges: 2);
+
+        // Assert
+        Assert.Equal(new[] { "second", "third" }, memory.Exchanges.Select(e => e.Query));
+    }
+
+    [Fact]
+    public void ConversationMemory_Add_ShouldTruncateLongAnswers()
+    {
+        // Arrange
+        var memory = new ConversationMemory();
+
+        // Act
+        memory.Add("What is Docker?", new string('x', 2000), maxExchanges: 5);
+        var context = memory.ToPromptContext();
+
+        // Assert
+        Assert.True(memory.Exchanges[0].Answer.Length < 600);
+        Assert.EndsWith("...", memory.Exchanges[0].Answer);
+        Assert.StartsWith("User: What is Docker?", context);
+        Assert.Contains("...", context);
+        Assert.True(context.Length < 600);
+        Assert.Equal(string.Empty, new ConversationMemory().ToPromptContext());
+    }
+
+    [Theory]
+    [InlineData(5, 15)]   // Reserve fits: remaining 25s minus the 10s reserve
+    [InlineData(15, 7.5)] // Reserve larger than half the remaining 15s: clamped to half
+    [InlineData(30, 0)]   // At the deadline
+    [InlineData(40, 0)]   // Already past the deadline
+    public void GetAgentBudget_ShouldClampToRemainingTime(double elapsedSeconds, double expectedSeconds)
+    {
+        // Act
+        var budget = OrchestratorAgent.GetAgentBudget(
+            TimeSpan.FromSeconds(30), TimeSpan.FromSeconds(10), TimeSpan.FromSeconds(elapsedSeconds));
+
+        // Assert
+        Assert.Equal(TimeSpan.FromSeconds(expectedSeconds), budget);
+    }
+
+    [Fact]
+    public async Task ExecuteWithinBudget_WhenAgentExceedsBudget_ShouldReturnFailedResponse()
+    {
+        // Arrange
+        var intent = new Intent { Type = IntentType.M365Email, Query = "summarize my emails" };
+        using var agentCts = new CancellationTokenSource();
+        agentCts.Cancel();
+
+        // Act
+        var response = await OrchestratorAgent.ExecuteWithinBudgetAsync(
+            intent,
+            async token => { await Task.Delay(Timeout.Infinite, token); return new AgentResponse(); },
+            TimeSpan.Zero,
+            agentCts.Token,
+            CancellationToken.None,
+            NullLogger.Instance);
+
+        // Assert
+        Assert.False(response.Success);
+        Assert.Equal(IntentType.M365Email, response.IntentType);
+        Assert.Equal("M365Email", response.Agent);
+    }
+
+    [Fact]
+    public async Task ExecuteWithinBudget_WhenRequestIsCancelled_ShouldPropagate()
+    {
+        // Arrange
+        var intent = new Intent { Type = IntentType.GeneralKnowledge, Query = "what is Docker" };
+        using var requestCts = new CancellationTokenSource();
+        requestCts.Cancel();
+
+        // Act & Assert
+        await Assert.ThrowsAnyAsync<OperationCanceledException>(() => OrchestratorAgent.ExecuteWithinBudgetAsync(
+            intent,
+            async token => { await Task.Delay(Timeout.Infinite, token); return new AgentResponse(); },
+            TimeSpan.Zero,
+            requestCts.Token,
+            requestCts.Token,
+            NullLogger.Instance));
+    }
+
+    [Fact]
+    public void GetM365Batch_WithMultipleM365Intents_ShouldBatchOnlyThem()
+    {
+        // Arrange
+        var intents = new List<Intent>
+        {
+            new() { Type = IntentType.M365Email, Query = "summarize my emails" },
+            new() { Type = IntentType.GeneralKnowledge, Query = "what is Docker" },
+            new() { Type = IntentType.M365Calendar, Query = "meetings tomorrow" }
+        };
+
+        // Act
+        var batch = OrchestratorAgent.GetM365Batch(intents, batchM365Intents: true);
+
+        // Assert
+        Assert.Equal(new[] { IntentType.M365Email, IntentType.M365Calendar }, batch.Select(i => i.Type));
+        Assert.Empty(OrchestratorAgent.GetM365Batch(intents, batchM365Intents: false));
+    }
+
+    [Fact]
+    public void GetM365Batch_WithSingleM365Intent_ShouldNotBatch()
+    {
+        // Arrange
+        var intents = new List<Intent>
+        {
+            new() { Type = IntentType.M365Email, Query = "summarize my emails" },
+            new() { Type = IntentType.GeneralKnowledge, Query = "what is Docker" }
+        };
+
+        // Act
+        var batch = OrchestratorAgent.GetM365Batch(intents, batchM365Intents: true);
+
+        // Assert
+        Assert.Empty(batch);
+    }
+
     [Fact]
     public void OrchestrationSettings_DefaultValues_ShouldBeCorrect()
     {
@@ -76,6 +232,10 @@ public class OrchestratorAgentTests
         // NOTE: Default is 30s but lab config uses 120s for Copilot API latency
         // This test verifies the model default, not the configured value
         Assert.Equal(30, settings.TimeoutSeconds);
+        Assert.Equal(10, settings.SynthesisReserveSeconds);
         Assert.True(settings.EnableParallelExecution);
+        Assert.False(settings.EnableSpeculativeExecution);
+        Assert.True(settings.BatchM365Intents);
+        Assert.Equal(5, settings.ConversationMemoryTurns);
     }
 }
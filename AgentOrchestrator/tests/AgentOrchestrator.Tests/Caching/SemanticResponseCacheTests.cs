@@ -0,0 +1,85 @@
+using AgentOrchestrator.Caching;
+using AgentOrchestrator.Models;
+using Microsoft.Extensions.AI;
+using Xunit;
+
+namespace AgentOrchestrator.Tests.Caching;
+
+public class SemanticResponseCacheTests
+{
+    [Fact]
+    public async Task Lookup_AfterStore_ShouldReturnExactMatch()
+    {
+        // Arrange
+        var cache = new SemanticResponseCache(new SemanticCacheSettings());
+        var miss = await cache.LookupAsync("IntentPlugin.AnalyzeIntent", "What is Docker?");
+        cache.Store(miss, "[{\"type\": \"GeneralKnowledge\"}]");
+
+        // Act
+        var hit = await cache.LookupAsync("IntentPlugin.AnalyzeIntent", "  what is docker?  ");
+        var otherScope = await cache.LookupAsync("AzureOpenAIPlugin.GeneralKnowledge", "What is Docker?");
+
+        // Assert
+        Assert.False(miss.IsHit);
+        Assert.True(hit.IsHit);
+        Assert.Equal("[{\"type\": \"GeneralKnowledge\"}]", hit.Value);
+        Assert.False(otherScope.IsHit);
+    }
+
+    [Fact]
+    public async Task Lookup_AfterTimeToLive_ShouldMiss()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var cache = new SemanticResponseCache(new SemanticCacheSettings { TimeToLiveSeconds = 60 }, timeProvider: clock);
+        cache.Store(await cache.LookupAsync("scope", "query"), "value");
+
+        // Act
+        clock.Advance(TimeSpan.FromSeconds(61));
+        var lookup = await cache.LookupAsync("scope", "query");
+
+        // Assert
+        Assert.False(lookup.IsHit);
+    }
+
+    [Fact]
+    public async Task Lookup_WithSimilarMatchDisallowed_ShouldOnlyHitExactQuery()
+    {
+        // Arrange - every query embeds to the same vector, so any paraphrase is a similarity match
+        var cache = new SemanticResponseCache(new SemanticCacheSettings(), new ConstantEmbeddingGenerator());
+        cache.Store(await cache.LookupAsync("scope", "emails from John"), "value");
+
+        // Act
+        var exactOnly = await cache.LookupAsync("scope", "emails from Jane", allowSimilarMatch: false);
+        var similar = await cache.LookupAsync("scope", "emails from Jane");
+
+        // Assert
+        Assert.False(exactOnly.IsHit);
+        Assert.True(similar.IsHit);
+    }
+
+    [Theory]
+    [InlineData(new[] { 1f, 0f }, new[] { 1f, 0f }, 1.0)]
+    [InlineData(new[] { 1f, 0f }, new[] { 0f, 1f }, 0.0)]
+    [InlineData(new[] { 1f, 0f }, new[] { 1f }, 0.0)]
+    public void CosineSimilarity_ShouldCompareVectors(float[] x, float[] y, double expected)
+    {
+        Assert.Equal(expected, SemanticResponseCache.CosineSimilarity(x, y), precision: 6);
+    }
+
+    private sealed class ConstantEmbeddingGenerator : IEmbeddingGenerator<string, Embedding<float>>
+    {
+        public Task<GeneratedEmbeddings<Embedding<float>>> GenerateAsync(
+            IEnumerable<string> values,
+            EmbeddingGenerationOptions? options = null,
+            CancellationToken cancellationToken = default) =>
+            Task.FromResult(new GeneratedEmbeddings<Embedding<float>>(
+                values.Select(_ => new Embedding<float>(new[] { 1f, 0f }))));
+
+        public object? GetService(Type serviceType, object? serviceKey = null) => null;
+
+        public void Dispose()
+        {
+        }
+    }
+}
@@ -0,0 +1,116 @@
+using AgentOrchestrator.Caching;
+using System.Text;
+using Xunit;
+
+namespace AgentOrchestrator.Tests.Caching;
+
+public class UserTokenCacheTests
+{
+    [Fact]
+    public async Task GetOrExchange_WithinLifetime_ShouldReuseToken()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var cache = new UserTokenCache(clock);
+        var token = CreateJwt(clock.GetUtcNow().AddHours(1));
+        var exchanges = 0;
+
+        // Act
+        var first = await cache.GetOrExchangeAsync("key", () => { exchanges++; return Task.FromResult(token); });
+        var second = await cache.GetOrExchangeAsync("key", () => { exchanges++; return Task.FromResult(token); });
+
+        // Assert
+        Assert.Equal(token, first);
+        Assert.Equal(token, second);
+        Assert.Equal(1, exchanges);
+    }
+
+    [Fact]
+    public async Task GetOrExchange_NearExpiry_ShouldExchangeAgain()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var cache = new UserTokenCache(clock);
+        var token = CreateJwt(clock.GetUtcNow().AddMinutes(5));
+        var exchanges = 0;
+        await cache.GetOrExchangeAsync("key", () => { exchanges++; return Task.FromResult(token); });
+
+        // Act
+        clock.Advance(TimeSpan.FromMinutes(4.5));
+        await cache.GetOrExchangeAsync("key", () => { exchanges++; return Task.FromResult(token); });
+
+        // Assert
+        Assert.Equal(2, exchanges);
+    }
+
+    [Fact]
+    public async Task GetOrExchange_AfterInvalidate_ShouldExchangeAgain()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var cache = new UserTokenCache(clock);
+        var rejected = CreateJwt(clock.GetUtcNow().AddHours(1));
+        var refreshed = CreateJwt(clock.GetUtcNow().AddHours(2));
+        await cache.GetOrExchangeAsync("key", () => Task.FromResult(rejected));
+
+        // Act
+        cache.Invalidate("key");
+        var token = await cache.GetOrExchangeAsync("key", () => Task.FromResult(refreshed));
+
+        // Assert
+        Assert.Equal(refreshed, token);
+    }
+
+    [Fact]
+    public async Task GetOrExchange_ConcurrentMisses_ShouldShareOneExchange()
+    {
+        // Arrange
+        var cache = new UserTokenCache();
+        var pending = new TaskCompletionSource<string>();
+        var exchanges = 0;
+        Task<string> Exchange() { Interlocked.Increment(ref exchanges); return pending.Task; }
+
+        // Act
+        var first = cache.GetOrExchangeAsync("key", Exchange);
+        var second = cache.GetOrExchangeAsync("key", Exchange);
+        pending.SetResult(CreateJwt(DateTimeOffset.UtcNow.AddHours(1)));
+        var tokens = await Task.WhenAll(first, second);
+
+        // Assert
+        Assert.Equal(1, exchanges);
+        Assert.Equal(tokens[0], tokens[1]);
+    }
+
+    [Fact]
+    public async Task GetOrExchange_WithOpaqueToken_ShouldNotCache()
+    {
+        // Arrange
+        var cache = new UserTokenCache();
+        var exchanges = 0;
+
+        // Act
+        await cache.GetOrExchangeAsync("key", () => { exchanges++; return Task.FromResult("opaque-token"); });
+        await cache.GetOrExchangeAsync("key", () => { exchanges++; return Task.FromResult("opaque-token"); });
+
+        // Assert
+        Assert.Equal(2, exchanges);
+    }
+
+    [Fact]
+    public void CreateKey_ShouldDifferPerUser()
+    {
+        var scopes = new[] { "User.Read", "Mail.Read" };
+
+        Assert.NotEqual(
+            UserTokenCache.CreateKey("me", "tenant", "user-1", scopes),
+            UserTokenCache.CreateKey("me", "tenant", "user-2", scopes));
+    }
+
+    private static string CreateJwt(DateTimeOffset expiresAt)
+    {
+        static string Encode(string json) => Convert.ToBase64String(Encoding.UTF8.GetBytes(json))
+            .TrimEnd('=').Replace('+', '-').Replace('/', '_');
+
+        return $"{Encode("{\"alg\":\"none\",\"typ\":\"JWT\"}")}.{Encode($"{{\"exp\":{expiresAt.ToUnixTimeSeconds()}}}")}.";
+    }
+}
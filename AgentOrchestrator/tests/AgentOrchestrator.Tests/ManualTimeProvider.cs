@@ -0,0 +1,13 @@
+namespace AgentOrchestrator.Tests;
+
+/// <summary>
+/// A clock that only moves when the test advances it, for testing expiry of cached entries.
+/// </summary>
+internal sealed class ManualTimeProvider : TimeProvider
+{
+    private DateTimeOffset _now = DateTimeOffset.UtcNow;
+
+    public override DateTimeOffset GetUtcNow() => _now;
+
+    public void Advance(TimeSpan delta) => _now += delta;
+}
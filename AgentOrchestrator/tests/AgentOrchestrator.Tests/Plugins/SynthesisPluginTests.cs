@@ -0,0 +1,27 @@
+using AgentOrchestrator.Models;
+using AgentOrchestrator.Plugins;
+using System.Text.Json;
+using Xunit;
+
+namespace AgentOrchestrator.Tests.Plugins;
+
+public class SynthesisPluginTests
+{
+    [Fact]
+    public void FormatResponsesForSynthesis_ShouldMatchSerializedProjection()
+    {
+        // Arrange
+        var responses = new List<AgentResponse>
+        {
+            new() { Agent = "m365_copilot", IntentType = IntentType.M365Email, Content = "You have 3 \"urgent\" emails" },
+            new() { Agent = "azure_openai", IntentType = IntentType.GeneralKnowledge, Content = "Docker is a container runtime.\nIt's popular." }
+        };
+        var expected = JsonSerializer.Serialize(responses.Select(r => new { agent = r.Agent, content = r.Content }));
+
+        // Act
+        var result = SynthesisPlugin.FormatResponsesForSynthesis(responses);
+
+        // Assert
+        Assert.Equal(expected, result);
+    }
+}